@@ -13,13 +13,13 @@ and `web service reference <https://github.com/SalesforceEng/Argus/wiki/Web%20Se
 
 import json
 import logging
-import os
 from six import string_types, iteritems, itervalues, iterkeys
 from six.moves import http_client as httplib
-from collections import Mapping
+from collections.abc import Mapping
 from functools import wraps
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .model import Namespace, Metric, Annotation, Dashboard, Alert, Trigger, Notification, JsonEncoder, JsonDecoder, \
     Permission, Derivative
@@ -29,7 +29,6 @@ REQ_PATH = "req_path"
 REQ_PARAMS = "req_params"
 REQ_BODY = "req_body"
 
-
 class ArgusException(Exception):
     """
     An exception type that is thrown for Argus service errors.
@@ -972,7 +971,8 @@ class ArgusServiceClient(object):
          Interfaces with the Argus derivatives endpoint.
     """
 
-    def __init__(self, user, password, endpoint, timeout=(10, 300), refreshToken=None, accessToken=None):
+    def __init__(self, user, password, endpoint, timeout=(10, 300), refreshToken=None, accessToken=None, verify=True,
+                 pool_maxsize=None, session=None):
         """
         Creates a new client object to interface with the Argus RESTful API.
 
@@ -988,6 +988,12 @@ class ArgusServiceClient(object):
         :type refreshToken: str
         :param accessToken: A token that can be used to authenticate with Argus. If a ``refreshToken`` or ``password`` is specified, the ``accessToken`` will be refreshed as and when it is needed.
         :type refreshToken: str
+        :param verify: Whether to verify the TLS certificate of the endpoint, or the path to a CA bundle to verify it with. This is configured once on the underlying session, which also keeps the connections (and TLS sessions) alive across requests. For more information, see `Requests SSL Cert Verification <http://docs.python-requests.org/en/latest/user/advanced/#ssl-cert-verification>`__
+        :type verify: bool or str
+        :param pool_maxsize: The maximum number of connections to keep alive per host, raise this when making many concurrent requests through the same client. By default, the pool size of ``requests`` is kept.
+        :type pool_maxsize: int
+        :param session: An existing session to send the requests through, instead of creating a new one. It is used as is, so ``verify`` and ``pool_maxsize`` are not applied to it.
+        :type session: requests.Session
         """
         if not user:
             raise ValueError("A valid user must be specified")
@@ -1011,7 +1017,27 @@ class ArgusServiceClient(object):
         self.namespaces = NamespacesServiceClient(self)
         self.alerts = AlertsServiceClient(self)
         self.derivatives = DerivativeServiceClient(self)
-        self.conn = requests.Session()
+        if session is None:
+            session = requests.Session()
+            session.verify = verify
+            if pool_maxsize is not None:
+                adapter = HTTPAdapter(pool_maxsize=pool_maxsize)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+        self.conn = session
+
+    @property
+    def accessToken(self):
+        """ The token used to authenticate the requests, setting it also updates the headers sent with each request. """
+        return self._accessToken
+
+    @accessToken.setter
+    def accessToken(self, value):
+        self._accessToken = value
+        # Argus seems to recognized "Accept" header for "application/json" and "application/ms-excel", but the former is the default.
+        self._headers = {"Content-Type": "application/json"}
+        if value:
+            self._headers["Authorization"] = "Bearer " + value
 
     def login(self):
         """
@@ -1053,18 +1079,14 @@ class ArgusServiceClient(object):
         :param path: The Argus path on which the request needs to be made, e.g. `/auth/login`
         :type path: str
         """
-        url = os.path.join(self.endpoint, path)
+        # Plain concatenation, os.path.join() is meant for file system paths.
+        url = self.endpoint + path if self.endpoint.endswith("/") else self.endpoint + "/" + path
         req_method = getattr(self.conn, method)
         data = dataObj and json.dumps(dataObj, cls=encCls) or None
         logging.debug("%s request with params: %s data length %s on: %s", method.upper(), params,
                       data and len(data) or 0, url)  # Mainly for the sake of data length
-        # Argus seems to recognized "Accept" header for "application/json" and "application/ms-excel", but the former is the default.
-        headers = {"Content-Type": "application/json"}
-        if self.accessToken:
-            headers["Authorization"] = "Bearer " + self.accessToken
-
         resp = req_method(url, data=data, params=params,
-                          headers=headers,
+                          headers=self._headers,
                           timeout=self.timeout)
         res = check_success(resp, decCls)
         return res
@@ -20,6 +20,17 @@ These functions can be combined with additional HTML tags to produce the require
     <ag-dashboard><h1>Test Dashboard</h1><hr/><ag-chart name="Chart"><ag-option name="title.text" value="hdara.test"/><ag-metric name="hdara.test.metric">-1d:-0d:test.scope:test.metric:sum</ag-metric></ag-chart></ag-dashboard>
 
 Argus cant't handle auto-closed XML tags, so using "html" `method` is recommended.
+
+For large dashboards, the tags can be created directly under their parent by passing it as `_parent`, instead of
+building each child on its own and moving it into the parent, or the whole dashboard can be built in a single pass
+with `DashboardBuilder`, which wraps `etree.TreeBuilder`:
+
+    >>> dashboard = DASHBOARD()
+    >>> chart = CHART(name="Chart", _parent=dashboard)
+    >>> title = TITLE("hdara.test", _parent=chart)
+
+If lxml is not installed, the tags are generated with the standard library `xml.etree.ElementTree` instead,
+through a minimal `ElementMaker` replacement, and `etree` refers to that module.
 """
 
 #
@@ -29,21 +40,81 @@ Argus cant't handle auto-closed XML tags, so using "html" `method` is recommende
 # For full license text, see LICENSE.txt file in the repo root  or https://opensource.org/licenses/BSD-3-Clause
 #
 
-import lxml.builder
+from functools import partial
+
+from six import string_types
+
+
+def _append_children(elem, children):
+    """ Adds the `children` to `elem` the way `ElementMaker` does: `dict` children are attributes, strings are text. """
+    for child in children:
+        if isinstance(child, dict):
+            elem.attrib.update(child)
+        elif isinstance(child, string_types):
+            if len(elem):
+                elem[-1].tail = (elem[-1].tail or "") + child
+            else:
+                elem.text = (elem.text or "") + child
+        else:
+            elem.append(child)
+
+
+try:
+    from lxml import etree
+    from lxml.builder import ElementMaker
+except ImportError:
+    import xml.etree.ElementTree as etree
+
+    class ElementMaker(object):
+        """
+        A minimal replacement for the lxml `ElementMaker` on top of `xml.etree.ElementTree`. Keyword arguments and
+        `dict` children become attributes, string children become text and elements are appended as children.
+        """
+
+        def __call__(self, tag, *children, **attrib):
+            elem = etree.Element(tag, attrib)
+            _append_children(elem, children)
+            return elem
+
+        def __getattr__(self, tag):
+            if tag.startswith("__"):
+                raise AttributeError(tag)
+            return partial(self, tag)
 
 #: Use this to create additional XML/HTML tags, e.g., `E.h1` will create the `<h1>` tag 
-E = lxml.builder.ElementMaker()
+E = ElementMaker()
+
+
+class _TagMaker(object):
+    """
+    Makes the elements for a tag. By default a new standalone element is returned, but when a `_parent` keyword
+    argument is passed, the element is created directly under that parent with `etree.SubElement`, instead of being
+    created on its own and then moved into the parent's document when it is appended.
+    """
+
+    def __init__(self, tag):
+        self.tag = tag
+        self._make = getattr(E, tag)
 
-_DASHBOARD = getattr(E, "ag-dashboard")
-_DATE = getattr(E, "ag-date")
-_TEXT = getattr(E, "ag-text")
-_SUBMIT = getattr(E, "ag-submit")
-_CHART = getattr(E, "ag-chart")
-_OPTION = getattr(E, "ag-option")
-_METRIC = getattr(E, "ag-metric")
-_FLAGS = getattr(E, "ag-flags")
-_TABULAR = getattr(E, "ag-table")
-_STATUS_INDICATOR = getattr(E, "ag-status-indicator")
+    def __call__(self, *children, **attrib):
+        parent = attrib.pop("_parent", None)
+        if parent is None:
+            return self._make(*children, **attrib)
+        elem = etree.SubElement(parent, self.tag, attrib)
+        _append_children(elem, children)
+        return elem
+
+
+_DASHBOARD = _TagMaker("ag-dashboard")
+_DATE = _TagMaker("ag-date")
+_TEXT = _TagMaker("ag-text")
+_SUBMIT = _TagMaker("ag-submit")
+_CHART = _TagMaker("ag-chart")
+_OPTION = _TagMaker("ag-option")
+_METRIC = _TagMaker("ag-metric")
+_FLAGS = _TagMaker("ag-flags")
+_TABULAR = _TagMaker("ag-table")
+_STATUS_INDICATOR = _TagMaker("ag-status-indicator")
 
 
 def DASHBOARD(*args, **kwargs):
@@ -91,49 +162,49 @@ def TABULAR(*args, **kwargs):
     return _TABULAR(*args, **kwargs)
 
 
-def START_DATE(name="start", label="Start Date", default="-1d"):
+def START_DATE(name="start", label="Start Date", default="-1d", _parent=None):
     """ Generates a `ag-date` tag with sensible defaults for `name`, `label` and `default` for specifying a start date. """
-    return DATE(type="datetime", name=name, label=label, default=default)
+    return _DATE(type="datetime", name=name, label=label, default=default, _parent=_parent)
 
 
-def END_DATE(name="end", label="End Date", default="-0d"):
+def END_DATE(name="end", label="End Date", default="-0d", _parent=None):
     """ Generates a `ag-date` tag with sensible defaults for `name`, `label` and `default` for specifying end date. """
-    return DATE(type="datetime", name=name, label=label, default=default)
+    return _DATE(type="datetime", name=name, label=label, default=default, _parent=_parent)
 
 
-def TEXT_BOX(name, label=None, default=None):
+def TEXT_BOX(name, label=None, default=None, _parent=None):
     """ Generates a `ag-text` tag with sensible defaults for `type`, `name`, `label` and `default` for specifying text field. """
-    return TEXT(type="text", name=name, label=label or name.capitalize(), default=default or "")
+    return _TEXT(type="text", name=name, label=label or name.capitalize(), default=default or "", _parent=_parent)
 
 
-def TITLE(title):
+def TITLE(title, _parent=None):
     """ Generates a `ag-option` tag with the specified `title`. """
-    return OPTION(name="title.text", value=title)
+    return _OPTION(name="title.text", value=title, _parent=_parent)
 
 
-def SUB_TITLE(subTitle):
+def SUB_TITLE(subTitle, _parent=None):
     """ Generates a `ag-option` tag with the specified `subtitle`. """
-    return OPTION(name="subtitle.text", value=subTitle)
+    return _OPTION(name="subtitle.text", value=subTitle, _parent=_parent)
 
 
-def YMIN(value):
+def YMIN(value, _parent=None):
     """ Generates a `ag-option` tag with the specified yaxis.min value. """
-    return OPTION(name="yaxis.min", value=value)
+    return _OPTION(name="yaxis.min", value=value, _parent=_parent)
 
 
-def YMAX(value):
+def YMAX(value, _parent=None):
     """ Generates a `ag-option` tag with the specified yaxis.max value. """
-    return OPTION(name="yaxis.max", value=value)
+    return _OPTION(name="yaxis.max", value=value, _parent=_parent)
 
 
-def XMIN(value):
+def XMIN(value, _parent=None):
     """ Generates a `ag-option` tag with the specified xaxis.min value. """
-    return OPTION(name="xaxis.min", value=value)
+    return _OPTION(name="xaxis.min", value=value, _parent=_parent)
 
 
-def XMAX(value):
+def XMAX(value, _parent=None):
     """ Generates a `ag-option` tag with the specified xaxis.max value. """
-    return OPTION(name="xaxis.max", value=value)
+    return _OPTION(name="xaxis.max", value=value, _parent=_parent)
 
 
 def AREA_CHART(*args, **kwargs):
@@ -144,3 +215,108 @@ def AREA_CHART(*args, **kwargs):
 def STATUS_INDICATOR(*args, **kwargs):
     """Generates an `ag-status-indicator` tag with the passed in `name`,`hi`,`low` and METRIC attributes"""
     return _STATUS_INDICATOR(*args, **kwargs)
+
+
+class DashboardBuilder(object):
+    """
+    Builds an `ag-dashboard` tag in a single pass with `etree.TreeBuilder`, as an alternative to the nested tag
+    functions for generating large dashboards. Container tags such as charts are opened by their method and stay open
+    until `end()` is called, while the other tags are added to the currently open tag. The dashboard is available as
+    `dashboard` once the builder is closed, which happens automatically at the end of the `with` block:
+
+        >>> with DashboardBuilder() as b:
+        ...     b.start_date()
+        ...     b.chart(name="Chart")
+        ...     b.title("hdara.test")
+        ...     b.metric("-1d:-0d:test.scope:test.metric:sum", name="hdara.test.metric")
+        ...     b.end()
+        >>> dashboard = b.dashboard
+    """
+
+    def __init__(self, **attrib):
+        self._builder = etree.TreeBuilder()
+        self._open = []
+        self.dashboard = None
+        self.start("ag-dashboard", **attrib)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+
+    def start(self, tag, text=None, **attrib):
+        """ Opens a `tag` with the given `text` and attributes, subsequent tags are added under it until `end()`. """
+        self._builder.start(tag, attrib)
+        if text:
+            self._builder.data(text)
+        self._open.append(tag)
+
+    def end(self):
+        """ Closes the most recently opened tag. """
+        self._builder.end(self._open.pop())
+
+    def element(self, tag, text=None, **attrib):
+        """ Adds a `tag` with the given `text` and attributes to the currently open tag. """
+        self.start(tag, text, **attrib)
+        self.end()
+
+    def close(self):
+        """ Closes all the open tags and returns the dashboard. """
+        while self._open:
+            self.end()
+        self.dashboard = self._builder.close()
+        return self.dashboard
+
+    def chart(self, **attrib):
+        """ Opens an `ag-chart` tag. """
+        self.start("ag-chart", **attrib)
+
+    def area_chart(self, **attrib):
+        """ Opens an `ag-chart` tag with `type='stackarea'`. """
+        self.start("ag-chart", type="stackarea", **attrib)
+
+    def tabular(self, **attrib):
+        """ Opens an `ag-table` tag. """
+        self.start("ag-table", **attrib)
+
+    def status_indicator(self, **attrib):
+        """ Opens an `ag-status-indicator` tag. """
+        self.start("ag-status-indicator", **attrib)
+
+    def metric(self, expression, **attrib):
+        """ Adds an `ag-metric` tag for the specified `expression`. """
+        self.element("ag-metric", expression, **attrib)
+
+    def flags(self, expression, **attrib):
+        """ Adds an `ag-flags` tag for the specified `expression`. """
+        self.element("ag-flags", expression, **attrib)
+
+    def option(self, **attrib):
+        """ Adds an `ag-option` tag. """
+        self.element("ag-option", **attrib)
+
+    def title(self, title):
+        """ Adds an `ag-option` tag with the specified `title`. """
+        self.option(name="title.text", value=title)
+
+    def sub_title(self, subTitle):
+        """ Adds an `ag-option` tag with the specified `subtitle`. """
+        self.option(name="subtitle.text", value=subTitle)
+
+    def start_date(self, name="start", label="Start Date", default="-1d"):
+        """ Adds an `ag-date` tag with the same defaults as `START_DATE`. """
+        self.element("ag-date", type="datetime", name=name, label=label, default=default)
+
+    def end_date(self, name="end", label="End Date", default="-0d"):
+        """ Adds an `ag-date` tag with the same defaults as `END_DATE`. """
+        self.element("ag-date", type="datetime", name=name, label=label, default=default)
+
+    def text_box(self, name, label=None, default=None):
+        """ Adds an `ag-text` tag with the same defaults as `TEXT_BOX`. """
+        self.element("ag-text", type="text", name=name, label=label or name.capitalize(), default=default or "")
+
+    def submit(self, **attrib):
+        """ Adds an `ag-submit` tag. """
+        self.element("ag-submit", **attrib)
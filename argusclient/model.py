@@ -10,11 +10,18 @@ Module containing the classes that model the Argus base objects.
 #
 
 import json
-from six import string_types, iteritems
+from six import string_types, iteritems, viewkeys
 
 
 class BaseEncodable(object):
 
+    def __init_subclass__(cls, **kwargs):
+        super(BaseEncodable, cls).__init_subclass__(**kwargs)
+        # Split the id_fields into the fields required as is and the groups of aliases, once per class.
+        id_fields = getattr(cls, "id_fields", ())
+        cls._required_fields = frozenset(f for f in id_fields if not isinstance(f, tuple))
+        cls._alias_fields = tuple(frozenset(f) for f in id_fields if isinstance(f, tuple))
+
     def __init__(self, **kwargs):
         for k, v in iteritems(kwargs):
             setattr(self, k, v)
@@ -25,16 +32,12 @@ class BaseEncodable(object):
 
     @classmethod
     def from_dict(cls, D):
-        for f in cls.id_fields:
-            if isinstance(f, tuple):
-                if any(alias in D for alias in f):
-                    continue
-                else:
-                    return None
-            elif f not in D:
+        if not viewkeys(D) >= cls._required_fields:
+            return None
+        for f in cls._alias_fields:
+            if viewkeys(D).isdisjoint(f):
                 return None
-        else:
-            return cls(**D)
+        return cls(**D)
 
     @property
     def argus_id(self):
@@ -526,6 +529,11 @@ class JsonEncoder(json.JSONEncoder):
         return json.JSONEncoder.default(self, obj)
 
 
+#: The classes :class:`JsonDecoder` tries in this order, the first one whose ``from_dict`` accepts an object decodes it.
+_DECODABLE_CLASSES = (Metric, Dashboard, AddListResult, User, Namespace, Annotation,
+                      Alert, Trigger, Notification, Permission, Derivative)
+
+
 class JsonDecoder(json.JSONDecoder):
     def __init__(self, *args, **kwargs):
         kwargs['object_hook'] = self.from_json
@@ -534,8 +542,7 @@ class JsonDecoder(json.JSONDecoder):
     def from_json(self, jsonObj):
         if not jsonObj or not isinstance(jsonObj, dict):
             return jsonObj
-        for cls in (Metric, Dashboard, AddListResult, User, Namespace, Annotation,
-                    Alert, Trigger, Notification, Permission, Derivative):
+        for cls in _DECODABLE_CLASSES:
             obj = cls.from_dict(jsonObj)
             if obj:
                 return obj
@@ -5,7 +5,7 @@
 # For full license text, see LICENSE.txt file in the repo root  or https://opensource.org/licenses/BSD-3-Clause
 #
 
-import requests, time, calendar, csv, getpass, logging, os
+import requests, time, calendar, csv, getpass, logging, os, re
 from optparse import OptionParser
 
 # Use the package in this repo (argusclient directory)
@@ -133,8 +133,34 @@ def to_gmt_epoch(tsstr):
     return calendar.timegm(time.strptime(tsstr[:19], opts.dateformat)) * 1000
 
 
+# Conversion function for metric values, returns an int, or a float if it has a decimal point, or None if it is not numeric
+def parse_num(val):
+    try:
+        return float(val) if "." in val else int(val)
+    except ValueError:
+        # exponent notation and the like
+        try:
+            return float(val)
+        except ValueError:
+            return None
+
+
+# Splits the scope template once around its {keyName} placeholders, alternating literals and key names, so that the
+# per-row substitution is a single join. Any other braces are kept as is, like replacing each placeholder would.
+def compile_scope(scope, keyNames):
+    if not keyNames:
+        return [scope]
+    return re.split("{(%s)}" % "|".join(re.escape(keyName) for keyName in keyNames), scope)
+
+
 def parse_csv_into_metrics(csvfile):
 
+    # parse the scope template once for all the rows
+    scopeTokens = compile_scope(opts.argusscope, keyNames or ())
+
+    # check the log level once, rather than formatting messages per row
+    log_debug = logging.root.isEnabledFor(logging.DEBUG)
+
     with open(csvfile, 'r') as input:
         # Use a CSV reader to iterate through the results, creating a list named data
         csvr = csv.reader(input)
@@ -142,7 +168,8 @@ def parse_csv_into_metrics(csvfile):
         cols = None
         data = []
         for row in csvr:
-            logging.debug("Got row: %s", row)
+            if log_debug:
+                logging.debug("Got row: %s", row)
             # Assign cols from the first row, the header in the CSV
             if not cols:
                 cols = row
@@ -152,16 +179,16 @@ def parse_csv_into_metrics(csvfile):
             if not opts.timestampcolumn in cols:
                 logging.error("Error: Timestamp column \"" + opts.timestampcolumn + "\" not present in header row.")
                 return None
-        if tagNames:
+            if tagNames:
                 for tagName in tagNames:
                     if not tagName in cols:
-                            logging.error("Error: tagName \"" + tagName + "\" not in column headers.")
-                            return None
-        if keyNames:
+                        logging.error("Error: tagName \"" + tagName + "\" not in column headers.")
+                        return None
+            if keyNames:
                 for keyName in keyNames:
                     if not keyName in cols:
-                            logging.error("Error: keyName \"" + keyName + "\" not in column headers.")
-                            return None
+                        logging.error("Error: keyName \"" + keyName + "\" not in column headers.")
+                        return None
             for metricName in metricNames:
                 if not metricName in cols:
                     logging.error("Error: metricName \"" + metricName + "\" not in column headers.")
@@ -188,26 +215,23 @@ def parse_csv_into_metrics(csvfile):
                 return None
             # Fail if the timestamp value is blank    
             if not ts:
-                logging.error("Error: Parse error for Timestamp value on row " + rowNum + ". Value=\"" + row[opts.timestampcolumn] + "\"")
+                logging.error("Error: Parse error for Timestamp value on row " + str(rowNum) + ". Value=\"" + row[opts.timestampcolumn] + "\"")
                 return None
 
             # create final scope, substitute keys into the scope
-            rowScope = opts.argusscope
-
-            # abort without arguskeys
-            if keyNames:
-                for keyName in keyNames:
-                    logging.debug("Subbing keyName " + keyName + " with value " + str(row[keyName]))
-                    rowScope = rowScope.replace("{" + keyName + "}", row[keyName])
-                    logging.debug("New rowScope = " + rowScope)
+            rowScope = "".join(row[token] if i % 2 else token for i, token in enumerate(scopeTokens))
+            if log_debug:
+                logging.debug("New rowScope = %s", rowScope)
 
             # create tags
             tag_dict = {}
             if tagNames:
                 for tagName in tagNames:
-                    logging.debug("Setting tag pair for name: " + tagName + " and value: " + str(row[tagName]))
+                    if log_debug:
+                        logging.debug("Setting tag pair for name: %s and value: %s", tagName, row[tagName])
                     # abort without argustags
                     tag_dict[tagName] = row[tagName]
+            tag_key = tuple(tag_dict[tagName] for tagName in tagNames or ())
 
             # create metrics and datapoints
             for col in metricNames:
@@ -216,26 +240,25 @@ def parse_csv_into_metrics(csvfile):
                 val = row[col]
 
                 # cast str to number
-                if val.isdigit():
-                    val = int(val)
-                else:
-                    try:
-                        val = float(val)
-                    except:
-                         logging.error("Error: Non-numeric metric found: %s", row)
-                         return None
-
-
-                # add a Metric object to m_dict if it doesn't already exist [namespace]:scope:metric{tags}
-                if opts.argusnamespace:
-                    metric = Metric(scope=rowScope, metric=col, tags=tag_dict, namespace=opts.argusnamespace)
-                else:
-                    metric = Metric(scope=rowScope, metric=col, tags=tag_dict)
-
-                metric_key = str(metric)
-                metric = m_dict.setdefault(str(metric), metric)     
-                
-                logging.debug("Setting new metric with key: " + metric_key + " ts: " + str(ts) + " and val: " + str(val))
+                val = parse_num(val)
+                if val is None:
+                    logging.error("Error: Non-numeric metric found: %s", row)
+                    return None
+
+
+                # add a Metric object to m_dict if it doesn't already exist [namespace]:scope:metric{tags},
+                # keyed by its components so that a Metric is only created the first time it is seen
+                metric_key = (rowScope, col, tag_key)
+                metric = m_dict.get(metric_key)
+                if metric is None:
+                    if opts.argusnamespace:
+                        metric = Metric(scope=rowScope, metric=col, tags=tag_dict, namespace=opts.argusnamespace)
+                    else:
+                        metric = Metric(scope=rowScope, metric=col, tags=tag_dict)
+                    m_dict[metric_key] = metric
+
+                if log_debug:
+                    logging.debug("Setting new metric with key: %s ts: %s and val: %s", metric_key, ts, val)
 
                 # add a datapoint for this row/col combination, using the timestamp as the key
                 metric.datapoints[ts] = val
@@ -5,7 +5,7 @@
 # For full license text, see LICENSE.txt file in the repo root  or https://opensource.org/licenses/BSD-3-Clause
 #
 
-import requests, sys, json, os, time, calendar, csv, getpass, logging
+import requests, sys, json, os, io, time, calendar, csv, getpass, logging, re
 from optparse import OptionParser, Option, OptionValueError
 from six import itervalues
 from six.moves import urllib
@@ -100,6 +100,8 @@ if not opts.argusmetrics:
     parser.error("Missing required argusmetrics command-line argument")
 if not opts.arguskeys:
     parser.error("Missing required arguskeys command-line argument")
+if not opts.argusscope:
+    parser.error("Missing required argusscope command-line argument")
 
 # build lists for multivalue options
 if opts.argustags:
@@ -120,6 +122,54 @@ def to_gmt_epoch(tsstr):
     # tsstr is expected to be in the default Splunk format: "2015-11-01T00:00:00.000+00:00", return epoch time in ms resolution
     return calendar.timegm(time.strptime(tsstr[:19], "%Y-%m-%dT%H:%M:%S"))*1000
 
+# Conversion function for metric values, returns an int, or a float if it has a decimal point, or None if it is not numeric
+def parse_num(val):
+    try:
+        return float(val) if "." in val else int(val)
+    except ValueError:
+        # exponent notation and the like
+        try:
+            return float(val)
+        except ValueError:
+            return None
+
+# Splits the scope template once around its {keyName} placeholders, alternating literals and key names, so that the
+# per-row substitution is a single join. Any other braces are kept as is, like replacing each placeholder would.
+def compile_scope(scope, keyNames):
+    if not keyNames:
+        return [scope]
+    return re.split("{(%s)}" % "|".join(re.escape(keyName) for keyName in keyNames), scope)
+
+# Conversion function for the metric columns of a result row, returns the numeric values in metricNames order
+def convert_row(row, metricNames):
+    vals = []
+    for col in metricNames:
+        # abort without argusmetrics
+        try:
+            val = row[col]
+        except KeyError:
+            # Key is not present
+            logging.error("Error: Specified metrics not found: %s", row)
+            return None
+
+        # abort for non-numeric metrics
+        val = parse_num(val)
+        if val is None:
+            logging.error("Error: Non-numeric metric found: %s", row)
+            return None
+        vals.append(val)
+    return vals
+
+# Function to wait for a Splunk job to complete, polling with an exponential backoff so that quick jobs are picked up
+# early without hammering Splunk for slow ones. A job that is done is also ready, so there is no need to poll for both.
+def wait_job(job, initial=0.05, cap=2.0):
+    delay = initial
+    while not job.is_done():
+        if opts.verbose:
+            logging.info("Still waiting for job to be completed..")
+        time.sleep(delay)
+        delay = min(delay * 1.5, cap)
+
 # Function to connect to Splunk, execute query, return results as dictionary
 def get_splunk_metrics(opts):
 
@@ -151,44 +201,32 @@ def get_splunk_metrics(opts):
         logging.info("Submitting job to Splunk..")
     job = service.jobs.create(splunkquery)
     if not opts.quiet:
-        logging.info("Waiting for job to be ready..")
-    while not job.is_ready():
-        if opts.verbose:
-            logging.info("Still waiting for job to be ready..")
-        time.sleep(1)
-    else:
-        if not opts.quiet:
-            logging.info("Job is ready, waiting for completion..")
-    while not job.is_done():
-        if opts.verbose:
-            logging.info("Still waiting for job to be completed..")
-        time.sleep(2)
-    else:
-        if not opts.quiet:
-            logging.info("Job is done, collecting results..")
+        logging.info("Waiting for job to complete..")
+    wait_job(job)
+    if not opts.quiet:
+        logging.info("Job is done, collecting results..")
+
+    # parse the scope template once for all the rows
+    scopeTokens = compile_scope(opts.argusscope, keyNames)
 
-    # Assign job results, in CSV format, all records, to results
-    results = job.results(output_mode="csv", count=0)
-    # Use a CSV reader to iterate through the results, creating a list named data
+    # Stream the job results, in CSV format, all records, decoding them as they are read instead of buffering them
+    results = io.TextIOWrapper(io.BufferedReader(job.results(output_mode="csv", count=0)), encoding="utf-8")
+    # Use a CSV reader to iterate through the results
     csvr = csv.reader(results)
-    # var for column names from first row in result
-    cols = None
-    data = []
-    for row in csvr:
-        logging.info("Got row: %s", row)
-        # Assign cols from the first row, the header in the CSV
-        if not cols:
-            cols = row
-            continue
-        # Append rows to data
-        data.append(dict(zip(cols, row)))
-    if not opts.quiet:
-        logging.info("Total result count: %s", len(data))
+    # var for column names from first row in result, the header in the CSV
+    cols = next(csvr, None)
+    rowCount = 0
+    # check the log level once, rather than formatting messages per row
+    log_debug = logging.root.isEnabledFor(logging.DEBUG)
 
-    # dictionary var to hold metrics
+    # dictionary var to hold the metrics of each scope and tags combination, as a list aligned with metricNames
     m_dict = {}
     # for loop to populate m_dict
-    for row in data:
+    for values in csvr:
+        if log_debug:
+            logging.debug("Got row: %s", values)
+        row = dict(zip(cols, values))
+        rowCount += 1
 
         # abort without timestamp
         try:
@@ -196,17 +234,15 @@ def get_splunk_metrics(opts):
         except KeyError:
             logging.error("Error: Timestamp not found: %s", row)
             return None
+        if not ts:
+            logging.warning("Skipping row with no timestamp: %s", row)
+            continue
 
-        # create final scope, substitute keys into the scope
-        rowScope = opts.argusscope
-
-        # abort without arguskeys
-        for keyName in keyNames:
-            try:
-                rowScope = rowScope.replace("{"+keyName+"}",row[keyName])
-            except KeyError:
-                logging.error("Error: Specified arguskeys not found: %s", row)
-                return None
+        # create final scope, substitute keys into the scope, abort without arguskeys
+        if not all(keyName in row for keyName in keyNames):
+            logging.error("Error: Specified arguskeys not found: %s", row)
+            return None
+        rowScope = "".join(row[token] if i % 2 else token for i, token in enumerate(scopeTokens))
 
         # create tags
         tag_dict = {}
@@ -218,49 +254,35 @@ def get_splunk_metrics(opts):
                 logging.error("Error: Specified tags not found: %s", row)
                 return None
 
-        # create metrics and datapoints
-        for col in metricNames:
-
-            m_key = (col)
-
-            # abort without argusmetrics
-            try:
-                val = row[col]
-            except KeyError:
-                # Key is not present
-                logging.error("Error: Specified metrics not found: %s", row)
-                return None
-
-            # abort for non-numeric metrics
-            try:
-                float(val)
-            except:
-                logging.error("Error: Non-numeric metric found: %s", row)
-                return None
+        # convert the metric values of this row, abort on missing or non-numeric metrics
+        vals = convert_row(row, metricNames)
+        if vals is None:
+            return None
 
-            # cast str to number
-            if "." in val:
-                val = float(val)
+        # add the Metric objects [namespace]:scope:metric{tags} to m_dict the first time the scope and tags are seen
+        m_key = (rowScope, tuple(tag_dict[tagName] for tagName in tagNames))
+        m_list = m_dict.get(m_key)
+        if m_list is None:
+            if opts.argusnamespace:
+                m_list = [Metric(scope=rowScope, metric=col, tags=tag_dict, namespace=opts.argusnamespace)
+                          for col in metricNames]
             else:
-                val = int(val)
-
-            # add a Metric object to m_dict if it doesn't already exist [namespace]:scope:metric{tags}
-            if not m_key in m_dict:
-                if opts.argusnamespace:
-                    m_dict[m_key] = Metric(scope=rowScope, metric=col, tags=tag_dict, namespace=opts.argusnamespace)
-                else:
-                    m_dict[m_key] = Metric(scope=rowScope, metric=col, tags=tag_dict)
-
-            # create a copy of the current Metric object for this metric
-            m = m_dict[m_key]
+                m_list = [Metric(scope=rowScope, metric=col, tags=tag_dict) for col in metricNames]
+            m_dict[m_key] = m_list
 
-            # add a datapoint for this row/col combination, using the timestamp as the key
+        # add a datapoint for each row/col combination, using the timestamp as the key
+        for m, val in zip(m_list, vals):
             m.datapoints[ts] = val
 
     if not opts.quiet:
-        logging.info("Total metric count: %s", len(m_dict))
+        logging.info("Total result count: %s", rowCount)
     job.cancel()
-    return list(itervalues(m_dict))
+
+    # the metrics of a scope and tags combination are only created for a row with values, so none is empty
+    metrics = [m for m_list in itervalues(m_dict) for m in m_list]
+    if not opts.quiet:
+        logging.info("Total metric count: %s", len(metrics))
+    return metrics
 
 metrics = get_splunk_metrics(opts)
 
@@ -5,7 +5,7 @@
 # For full license text, see LICENSE.txt file in the repo root  or https://opensource.org/licenses/BSD-3-Clause
 #
 
-import requests, sys, json, os, time, calendar, csv, getpass, logging
+import requests, sys, json, os, io, time, calendar, csv, getpass, logging
 from optparse import OptionParser, Option, OptionValueError
 from six import itervalues
 from six.moves import urllib
@@ -71,6 +71,27 @@ def to_gmt_epoch(tsstr):
     # tsstr is expected to be in the default Splunk format: "2015-11-01T00:00:00.000+00:00"
     return calendar.timegm(time.strptime(tsstr[:19], "%Y-%m-%dT%H:%M:%S"))
 
+# Conversion function for metric values, returns an int, or a float if it has a decimal point, or None if it is not numeric
+def parse_num(val):
+    try:
+        return float(val) if "." in val else int(val)
+    except ValueError:
+        # exponent notation and the like
+        try:
+            return float(val)
+        except ValueError:
+            return None
+
+# Function to wait for a Splunk job to complete, polling with an exponential backoff so that quick jobs are picked up
+# early without hammering Splunk for slow ones. A job that is done is also ready, so there is no need to poll for both.
+def wait_job(job, initial=0.05, cap=2.0):
+    delay = initial
+    while not job.is_done():
+        if opts.verbose:
+            logging.info("Still waiting for job to be completed..")
+        time.sleep(delay)
+        delay = min(delay * 1.5, cap)
+
 def get_splunk_metrics(opts):
     splunkendpoint = urllib.parse.urlsplit(opts.splunkapi)
     splunk_opts = {
@@ -103,64 +124,59 @@ def get_splunk_metrics(opts):
         logging.info("Submitting job to Splunk..")
     job = service.jobs.create(splunkquery.format(index=opts.index, pattern=opts.pattern, earliest=opts.earliest, latest=opts.latest, span=opts.span))
     if not opts.quite:
-        logging.info("Waiting for job to be ready..")
-    while not job.is_ready():
-        if opts.verbose:
-            logging.info("Still waiting for job to be ready..")
-        time.sleep(1)
-    else:
-        if not opts.quite:
-            logging.info("Job is ready, waiting for completion..")
-    while not job.is_done():
-        if opts.verbose:
-            logging.info("Still waiting for job to be completed..")
-        time.sleep(2)
-    else:
-        if not opts.quite:
-            logging.info("Job is done, collecting results..")
+        logging.info("Waiting for job to complete..")
+    wait_job(job)
+    if not opts.quite:
+        logging.info("Job is done, collecting results..")
 
-    results = job.results(output_mode="csv", count=0)
+    # Stream the results, decoding them as they are read instead of buffering them
+    results = io.TextIOWrapper(io.BufferedReader(job.results(output_mode="csv", count=0)), encoding="utf-8")
     csvr = csv.reader(results)
-    cols = None
-    data = []
-    for row in csvr:
-        logging.debug("Got row: %s", row)
-        if not cols:
-            cols = row
-            continue
-        data.append(dict(zip(cols, row)))
-    if not opts.quite:
-        logging.info("Total result count: %s", len(data))
+    cols = next(csvr, None)
+    rowCount = 0
+    # check the log level once, rather than formatting messages per row
+    log_debug = logging.root.isEnabledFor(logging.DEBUG)
 
     runts = int(time.time())
+    metricCols = [col for col in cols or () if col not in ("_time", "host")]
     m_dict = {}
     patternTagVal = opts.pattern.replace(" ", "__") # We can't have spaces in tag values.
-    for row in data:
+    for values in csvr:
+        if log_debug:
+            logging.debug("Got row: %s", values)
+        row = dict(zip(cols, values))
+        rowCount += 1
         host = row["host"]
         if not host:
-            logging.warn("Skipping row with no host: %s", row)
+            logging.warning("Skipping row with no host: %s", row)
             continue
-        for col in row:
-            if col in ("_time", "host") or not row[col]:
+        ts = row["_time"] and to_gmt_epoch(row["_time"]) or runts
+        # the metrics of each host, aligned with metricCols and created the first time a value is seen
+        m_list = m_dict.get(host)
+        if m_list is None:
+            m_list = m_dict[host] = [None] * len(metricCols)
+        for i, col in enumerate(metricCols):
+            raw = row.get(col)
+            if not raw:
                 continue
-            m_key = (host, col)
-            if not m_key in m_dict:
-                m_dict[m_key] = Metric(opts.scope, patternTagVal+"."+col, tags=dict(host=host, patternStr=patternTagVal), namespace=opts.namespace)
-            m = m_dict[m_key]
-            ts = row["_time"] and to_gmt_epoch(row["_time"]) or runts
-            val = row[col]
-            if "." in val:
-                val = float(val)
-            else:
-                val = int(val)
-            if logging.root.isEnabledFor(logging.DEBUG):
+            val = parse_num(raw)
+            if val is None:
+                logging.warning("Skipping non-numeric value for %s: %s", col, row)
+                continue
+            m = m_list[i]
+            if m is None:
+                m = m_list[i] = Metric(opts.scope, patternTagVal+"."+col, tags=dict(host=host, patternStr=patternTagVal), namespace=opts.namespace)
+            if log_debug:
                 logging.debug("Adding %s at timestamp: %s for metric: %s", val, ts, m.desc())
             m.datapoints[ts] = val
 
     if not opts.quite:
-        logging.info("Total metric count: %s", len(m_dict))
+        logging.info("Total result count: %s", rowCount)
+    metrics = [m for m_list in itervalues(m_dict) for m in m_list if m is not None]
+    if not opts.quite:
+        logging.info("Total metric count: %s", len(metrics))
     job.cancel()
-    return list(itervalues(m_dict))
+    return metrics
 
 metrics = get_splunk_metrics(opts)
 if metrics:
@@ -30,9 +30,9 @@ setup(name='argusclient',
       author_email='hdara@salesforce.com',
       url='https://github.com/SalesforceEng/argusclient',
       license="BSD-3-Clause",
-      packages=find_packages(exclude=['ez_setup', 'tests']),
-      include_package_data=True,
-      zip_safe=True,
+      packages=find_packages(exclude=['tests']),
+      zip_safe=False,
+      python_requires=">=3.8",
       install_requires=[
           "six>=1.12.0",
           "requests>=2.26.0",
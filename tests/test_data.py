@@ -55,6 +55,9 @@ derivativeSourceExpression = "-5m:-1m:argus.core:datapoints.queried:sum:2m-sum"
 derivativeInterval = "5m"
 derivedScope = "summary"
 
+# Fixtures that only differ from another one in a few fields are derived from it with dict(base, **overrides),
+# so that the rest of their contents (including nested lists and dicts) is shared rather than copied.
+
 metric_D = {
     "scope": scope,
     "metric": metric,
@@ -113,18 +116,7 @@ dashboard_D = {
     "description": "Test description"
 }
 
-dashboard_2_D = {
-    "id": testId2,
-    "createdById": 101402,
-    "createdDate": 1425598578661,
-    "modifiedById": 101402,
-    "modifiedDate": 1445273708714,
-    "name": "Oracle stats",
-    "content": content,
-    "ownerName": userName,
-    "shared": True,
-    "description": "Test description"
-}
+dashboard_2_D = dict(dashboard_D, id=testId2)
 
 groupPermission_D = {
     "type": groupPermissionIdentifier,
@@ -204,21 +196,7 @@ alert_D = {
     "ownerName": userName
 }
 
-alert_2_D = {
-    "id": testId2,
-    "createdById": 101997,
-    "createdDate": 1459857033871,
-    "modifiedById": 101997,
-    "modifiedDate": 1459857033871,
-    "name": alertName_2,
-    "expression": "-1d:hdara:test:sum",
-    "cronEntry": "*/15 * * * *",
-    "enabled": False,
-    "missingDataNotificationEnabled": False,
-    "notificationsIds": [],
-    "triggersIds": [],
-    "ownerName": userName
-}
+alert_2_D = dict(alert_D, id=testId2, name=alertName_2)
 
 trigger_D = {
     "id": testId,
@@ -235,20 +213,7 @@ trigger_D = {
     "notificationIds": []
 }
 
-trigger_2_D = {
-    "id": testId2,
-    "createdById": 101997,
-    "createdDate": 1459917155968,
-    "modifiedById": 101997,
-    "modifiedDate": 1459917155968,
-    "type": "GREATER_THAN",
-    "name": triggerName,
-    "threshold": 10000,
-    "secondaryThreshold": 0,
-    "inertia": 600000,
-    "alertId": 304255,
-    "notificationIds": []
-}
+trigger_2_D = dict(trigger_D, id=testId2)
 
 notification_D = {
     "id": testId,
@@ -268,41 +233,9 @@ notification_D = {
     "alertId": 304255
 }
 
-notification_2_D = {
-    "id": testId2,
-    "createdById": 101997,
-    "createdDate": 1459917506873,
-    "modifiedById": 101997,
-    "modifiedDate": 1459917506873,
-    "name": notificationName,
-    "notifierName": "com.salesforce.dva.argus.service.alert.notifier.EmailNotifier",
-    "subscriptions": [
-        email
-    ],
-    "metricsToAnnotate": [],
-    "cooldownPeriod": 0,
-    "cooldownExpiration": 0,
-    "triggersIds": [],
-    "alertId": 304255
-}
+notification_2_D = dict(notification_D, id=testId2)
 
-notification_3_D = {
-    "id": testId3,
-    "createdById": 101997,
-    "createdDate": 1459917506873,
-    "modifiedById": 101997,
-    "modifiedDate": 1459917506873,
-    "name": notificationName,
-    "notifierName": "com.salesforce.dva.argus.service.alert.notifier.EmailNotifier",
-    "subscriptions": [
-        email
-    ],
-    "metricsToAnnotate": [],
-    "cooldownPeriod": 0,
-    "cooldownExpiration": 0,
-    "triggersIds": [],
-    "alertId": 304255
-}
+notification_3_D = dict(notification_D, id=testId3)
 
 alert_all_info_D = {
     "id": testId,
@@ -322,23 +255,7 @@ alert_all_info_D = {
     "ownerName": userName
 }
 
-alert_all_info_2_D = {
-    "id": testId2,
-    "createdById": 101997,
-    "createdDate": 1459857033871,
-    "modifiedById": 101997,
-    "modifiedDate": 1459857033871,
-    "name": alertName_2,
-    "expression": "-1d:hdara:test:sum",
-    "cronEntry": "*/15 * * * *",
-    "enabled": False,
-    "missingDataNotificationEnabled": False,
-    "notificationsIds": [testId, testId, testId],
-    "triggersIds": [testId, testId],
-    "triggers": [trigger_D, trigger_2_D],
-    "notifications": [notification_D, notification_2_D, notification_3_D],
-    "ownerName": userName
-}
+alert_all_info_2_D = dict(alert_all_info_D, id=testId2, name=alertName_2)
 
 compalert_D = {
     'id': compAlertID,
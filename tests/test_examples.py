@@ -0,0 +1,50 @@
+#
+# Copyright (c) 2016, salesforce.com, inc.
+# All rights reserved.
+# Licensed under the BSD 3-Clause license.
+# For full license text, see LICENSE.txt file in the repo root  or https://opensource.org/licenses/BSD-3-Clause
+#
+import ast
+import os
+import re
+import unittest
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "examples")
+
+
+def load_function(script, name):
+    """ Returns the named top-level function of an example script, without running the script itself. """
+    with open(os.path.join(EXAMPLES_DIR, script)) as f:
+        tree = ast.parse(f.read(), script)
+    module = ast.Module(body=[node for node in tree.body if isinstance(node, ast.FunctionDef) and node.name == name],
+                        type_ignores=[])
+    namespace = dict(re=re)
+    exec(compile(module, script, "exec"), namespace)
+    return namespace[name]
+
+
+#: (scope, row) and the expected scope, as substituting each "{keyName}" with str.replace() gives it.
+SCOPES = (
+    (("{index}.appFeature.{pod}", dict(index="idx", pod="na1")), "idx.appFeature.na1"),
+    (("{index}.{other}", dict(index="idx")), "idx.{other}"),
+    (("a.{index:03d}", dict(index="idx")), "a.{index:03d}"),
+    (("a{b.{index}", dict(index="idx")), "a{b.idx"),
+    (("a}b.{index}", dict(index="idx")), "a}b.idx"),
+    (("{{index}}", dict(index="idx")), "{idx}"),
+    (("{index}", dict(index="")), ""),
+)
+
+
+class TestScopeTemplate(unittest.TestCase):
+    def testCompileScope(self):
+        for script in ("csv2argus.py", "splunk2argus.py"):
+            compile_scope = load_function(script, "compile_scope")
+            for (scope, row), expected in SCOPES:
+                with self.subTest(script=script, scope=scope):
+                    tokens = compile_scope(scope, sorted(row))
+                    self.assertEqual("".join(row[token] if i % 2 else token for i, token in enumerate(tokens)), expected)
+
+    def testNoKeys(self):
+        for script in ("csv2argus.py", "splunk2argus.py"):
+            with self.subTest(script=script):
+                self.assertEqual(load_function(script, "compile_scope")("a.{index}", ()), ["a.{index}"])
@@ -7,9 +7,9 @@
 
 import unittest, json
 
-import argusclient
 from argusclient import *
 from argusclient.model import *
+from argusclient.model import _DECODABLE_CLASSES
 
 from test_data import *
 
@@ -21,11 +21,9 @@ class ObjTest(unittest.TestCase):
 
     def testCreateMetric(self):
         m = Metric(scope, metric)
-        self.assertEqual(m.scope, scope)
-        self.assertEqual(m.metric, metric)
+        self._assertAttrs(m, scope=scope, metric=metric)
 
-        for k, v in list(datapoints.items()):
-            m.datapoints[k] = v
+        m.datapoints.update(datapoints)
         self.assertEqual(m.datapoints, datapoints)
 
         m.datapoints = {}
@@ -35,8 +33,7 @@ class ObjTest(unittest.TestCase):
         m.datapoints = datapoints
         self.assertEqual(m.datapoints, datapoints)
 
-        for k, v in list(tags.items()):
-            m.tags[k] = v
+        m.tags.update(tags)
         self.assertEqual(m.tags, tags)
 
         m.tags = {}
@@ -48,61 +45,43 @@ class ObjTest(unittest.TestCase):
 
         m = Metric(scope, metric, datapoints=datapoints)
         self.assertEqual(m.datapoints, datapoints)
-        self.assertEqual(str(m), scope+":"+metric)
+        self.assertEqual(str(m), f"{scope}:{metric}")
 
         m = Metric(scope, metric, namespace=namespace, displayName=displayName, unitType=unitType, id=testId)
-        self.assertEqual(m.namespace, namespace)
-        self.assertEqual(m.displayName, displayName)
-        self.assertEqual(m.unitType, unitType)
-        self.assertEqual(m.id, testId)
-        self.assertEqual(str(m), scope + ":" + metric + ":" + namespace)
+        self._assertAttrs(m, namespace=namespace, displayName=displayName, unitType=unitType, id=testId)
+        self.assertEqual(str(m), f"{scope}:{metric}:{namespace}")
 
         m.tags = tags
-        self.assertEqual(str(m), scope + ":" + metric + "{test.tag=test.value}" + ":" + namespace)
+        self.assertEqual(str(m), f"{scope}:{metric}{{test.tag=test.value}}:{namespace}")
 
     def testCreateDashboard(self):
         d = Dashboard(dashboardName, content, shared=False, id=testId)
-        self.assertEqual(d.name, dashboardName)
-        self.assertEqual(d.content, content)
-        self.assertEqual(d.id, testId)
+        self._assertAttrs(d, name=dashboardName, content=content, id=testId)
 
     def testCreateUserPermission(self):
         p = Permission(userPermissionIdentifier, permissionNames, username=userName)
-        self.assertEqual(p.type, userPermissionIdentifier)
-        self.assertEqual(p.permissionNames, permissionNames)
-        self.assertEqual(p.username, userName)
+        self._assertAttrs(p, type=userPermissionIdentifier, permissionNames=permissionNames, username=userName)
 
     def testCreateGroupPermission(self):
         p = Permission(groupPermissionIdentifier, permissionNames, groupId=permissionGroupId)
-        self.assertEqual(p.type, groupPermissionIdentifier)
-        self.assertEqual(p.permissionNames, permissionNames)
-        self.assertEqual(p.groupId, permissionGroupId)
+        self._assertAttrs(p, type=groupPermissionIdentifier, permissionNames=permissionNames, groupId=permissionGroupId)
 
     def testCreateUser(self):
         u = User(userName, email=email, id=testId)
-        self.assertEqual(u.userName, userName)
-        self.assertEqual(u.email, email)
-        self.assertEqual(u.id, testId)
+        self._assertAttrs(u, userName=userName, email=email, id=testId)
 
     def testCreateNamespace(self):
         n = Namespace(namespace, usernames=usernames)
-        self.assertEqual(n.qualifier, namespace)
-        self.assertEqual(n.usernames, usernames)
+        self._assertAttrs(n, qualifier=namespace, usernames=usernames)
 
     def testCreateAnnotation(self):
         a = Annotation(source, scope, metric, testId, timestamp, testType)
-        self.assertEqual(a.source, source)
-        self.assertEqual(a.scope, scope)
-        self.assertEqual(a.metric, metric)
-        self.assertEqual(a.id, testId)
-        self.assertEqual(a.timestamp, timestamp)
-        self.assertEqual(a.type, testType)
-        self.assertEqual(str(a), scope + ":" + metric + ":"+source)
-
-        for k, v in list(tags.items()):
-            a.tags[k] = v
+        self._assertAttrs(a, source=source, scope=scope, metric=metric, id=testId, timestamp=timestamp, type=testType)
+        self.assertEqual(str(a), f"{scope}:{metric}:{source}")
+
+        a.tags.update(tags)
         self.assertEqual(a.tags, tags)
-        self.assertEqual(str(a), scope + ":" + metric + "{test.tag=test.value}:" + source)
+        self.assertEqual(str(a), f"{scope}:{metric}{{test.tag=test.value}}:{source}")
 
         a.tags = {}
         a.tags.update(tags)
@@ -111,8 +90,7 @@ class ObjTest(unittest.TestCase):
         a.tags = tags
         self.assertEqual(a.tags, tags)
 
-        for k, v in list(fields.items()):
-            a.fields[k] = v
+        a.fields.update(fields)
         self.assertEqual(a.fields, fields)
 
         a.fields = {}
@@ -122,6 +100,21 @@ class ObjTest(unittest.TestCase):
         a.fields = fields
         self.assertEqual(a.fields, fields)
 
+    def testItemAssignment(self):
+        m = Metric(scope, metric)
+        for k, v in datapoints.items():
+            m.datapoints[k] = v
+        for k, v in tags.items():
+            m.tags[k] = v
+        self._assertAttrs(m, datapoints=datapoints, tags=tags)
+
+        a = Annotation(source, scope, metric, testId, timestamp, testType)
+        for k, v in tags.items():
+            a.tags[k] = v
+        for k, v in fields.items():
+            a.fields[k] = v
+        self._assertAttrs(a, tags=tags, fields=fields)
+
     def testAddListResult(self):
         errors = ["error1", "error2"]
         D = {
@@ -136,44 +129,35 @@ class ObjTest(unittest.TestCase):
 
     def testCreateAlert(self):
         a = Alert(alertName, alertQuery, alertCron)
-        self.assertEqual(a.name, alertName)
-        self.assertEqual(a.expression, alertQuery)
-        self.assertEqual(a.cronEntry, alertCron)
+        self._assertAttrs(a, name=alertName, expression=alertQuery, cronEntry=alertCron)
 
     def testCreateTrigger(self):
         t = Trigger(triggerName, Trigger.EQUAL, 100, 200)
-        self.assertEqual(t.name, triggerName)
-        self.assertEqual(t.type, Trigger.EQUAL)
-        self.assertEqual(t.threshold, 100)
-        self.assertEqual(t.inertia, 200)
+        self._assertAttrs(t, name=triggerName, type=Trigger.EQUAL, threshold=100, inertia=200)
 
     def testCreateTriggerInvalidType(self):
-        self.assertRaises(AssertionError, lambda: Trigger(triggerName, "abc", 100, 200))
+        with self.assertRaises(AssertionError):
+            Trigger(triggerName, "abc", 100, 200)
 
     def testCreateNotification(self):
         n = Notification(notificationName, notifierName=Notification.EMAIL, subscriptions=[email])
-        self.assertEqual(n.name, notificationName)
-        self.assertEqual(n.notifierName, Notification.EMAIL)
-        self.assertEqual(n.subscriptions, [email])
+        self._assertAttrs(n, name=notificationName, notifierName=Notification.EMAIL, subscriptions=[email])
 
     def testCreateNotificationInvalidNotifier(self):
-        self.assertRaises(AssertionError, lambda: Notification(notificationName, "abc"))
+        with self.assertRaises(AssertionError):
+            Notification(notificationName, "abc")
 
     def testCreateUserPermission(self):
         permission = Permission(userPermissionIdentifier, id=testId, permissionIds=permission_ids, username=username, entityId=testId)
-        self.assertEqual(permission.type, userPermissionIdentifier)
-        self.assertEqual(permission.entityId, testId)
-        self.assertEqual(permission.permissionIds, permission_ids)
-        self.assertEqual(permission.username, username)
+        self._assertAttrs(permission, type=userPermissionIdentifier, entityId=testId, permissionIds=permission_ids, username=username)
 
     def testCreateGroupPermission(self):
         permission = Permission(groupPermissionIdentifier, id=testId, groupId=group_id, entityId=testId)
-        self.assertEqual(permission.type, groupPermissionIdentifier)
-        self.assertEqual(permission.entityId, testId)
-        self.assertEqual(permission.groupId, group_id)
+        self._assertAttrs(permission, type=groupPermissionIdentifier, entityId=testId, groupId=group_id)
 
     def testCreateInvalidPermission(self):
-        self.assertRaises(AssertionError, lambda: Permission("abc", id=testId))
+        with self.assertRaises(AssertionError):
+            Permission("abc", id=testId)
 
     def testCreateAlertDeep(self):
         trigger = Trigger(triggerName, Trigger.EQUAL, 100, 200)
@@ -188,59 +172,43 @@ class ObjTest(unittest.TestCase):
 
     def testCreateDerivative(self):
         derivative = Derivative(derivativeName, derivativeSourceExpression, derivedScope, derivativeInterval)
-        self.assertEquals(derivative.name, derivativeName)
-        self.assertEquals(derivative.sourceExpression, derivativeSourceExpression)
-        self.assertEquals(derivative.derivedScope, derivedScope)
-        self.assertEquals(derivative.derivativeInterval, derivativeInterval)
+        self._assertAttrs(derivative, name=derivativeName, sourceExpression=derivativeSourceExpression, derivedScope=derivedScope,
+                          derivativeInterval=derivativeInterval)
+
+    def _assertAttrs(self, obj, **expected):
+        self.assertEqual({k: getattr(obj, k) for k in expected}, expected)
+
+
+#: Fixture and the model class it is expected to decode to.
+ENCODED_OBJS = (
+    (metric_D, Metric),
+    (annotation_D, Annotation),
+    (user_D, User),
+    (dashboard_D, Dashboard),
+    (userPermission_D, Permission),
+    (groupPermission_D, Permission),
+    (namespace_D, Namespace),
+    (addmetricresult_D, AddListResult),
+    (addannotationresult_D, AddListResult),
+    (alert_D, Alert),
+    (trigger_D, Trigger),
+    (notification_D, Notification),
+    (derivative_1_D, Derivative),
+)
 
 
 class TestEncoding(unittest.TestCase):
-    def setUp(self):
-        self.objClasses = []
-        for v in list(argusclient.__dict__.values()):
-            if v != BaseEncodable and isinstance(v, type) and issubclass(v, BaseEncodable):
-                self.objClasses.append(v)
-        if not self.objClasses:
+    @classmethod
+    def setUpClass(cls):
+        # Permission only requires a "type", which other objects have too, so JsonDecoder tries it after them.
+        cls.objClasses = [c for c in _DECODABLE_CLASSES if c is not Permission]
+        if not cls.objClasses:
             raise Exception("Found no classes of type BaseEncodable")
 
-    def testEncMetric(self):
-        self._testFor(metric_D, Metric)
-
-    def testEncAnnotation(self):
-        self._testFor(annotation_D, Annotation)
-
-    def testEncUser(self):
-        self._testFor(user_D, User)
-
-    def testEncDashboard(self):
-        self._testFor(dashboard_D, Dashboard)
-
-    def testEncUserPermission(self):
-        self._testFor(userPermission_D, Permission)
-
-    def testEncGroupPermission(self):
-        self._testFor(groupPermission_D, Permission)
-
-    def testEncNamespace(self):
-        self._testFor(namespace_D, Namespace)
-
-    def testEncAddMetricResult(self):
-        self._testFor(addmetricresult_D, AddListResult)
-
-    def testEncAddAnnotationResult(self):
-        self._testFor(addannotationresult_D, AddListResult)
-
-    def testEncAlert(self):
-        self._testFor(alert_D, Alert)
-
-    def testEncTrigger(self):
-        self._testFor(trigger_D, Trigger)
-
-    def testEncNotification(self):
-        self._testFor(notification_D, Notification)
-
-    def testEncDerivative(self):
-        self._testFor(derivative_1_D, Derivative)
+    def testEnc(self):
+        for i, (D, objClass) in enumerate(ENCODED_OBJS):
+            with self.subTest(i=i, objClass=objClass.__name__):
+                self._testFor(D, objClass)
 
     def testDecAlert(self):
         jsonStr = json.dumps(alert_all_info_D)
@@ -262,6 +230,13 @@ class TestEncoding(unittest.TestCase):
         o = json.loads(jsonStr, cls = JsonDecoder)
         self._assertType(o, Derivative)
 
+    def testIdFieldAliases(self):
+        D = dict(notification_D)
+        D["notifier"] = D.pop("notifierName")
+        self._assertType(Notification.from_dict(D), Notification)
+        del D["notifier"]
+        self.assertIsNone(Notification.from_dict(D))
+
     def testNonModel(self):
         D = dict(someRandomField="1", anotherRandomField="2")
         jsonStr = json.dumps(D)
@@ -286,7 +261,8 @@ class TestEncoding(unittest.TestCase):
         jsonStr = json.dumps(D)
         o = json.loads(jsonStr, cls=JsonDecoder)
         self._assertType(o, objClass)
-        self.assertEqual(json.loads(jsonStr), D)
+        # Compare the decoded object, instead of parsing the same string again.
+        self.assertEqual(o.to_dict(), D)
 
     def _assertType(self, obj, objClass):
         self.assertTrue(isinstance(obj, objClass),
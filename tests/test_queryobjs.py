@@ -6,49 +6,87 @@
 #
 
 import unittest
+from types import MappingProxyType
 
 from argusclient import *
 
-scope = "test.scope"
-metric = "test.metric"
-aggregator = "test.aggregator"
-tags = {"test.tag": "test.value"}
-namespace = "test.namespace"
-source = "test.source"
+from test_data import *
+
+#: Read-only view of the shared tags, so a query can't modify them for the other tests.
+TAGS = MappingProxyType(tags)
 stTime = "-1d"
 enTime = "-0d"
 
+#: The expected query expressions.
+EXPECT_ST_ONLY = "-1d:test.scope:test.metric:test.aggregator"
+EXPECT_TIME_RANGE = "-1d:-0d:test.scope:test.metric:test.aggregator"
+EXPECT_WITH_TAGS = "-1d:test.scope:test.metric{test.tag=test.value}:test.aggregator"
+EXPECT_WITH_NAMESPACE = "-1d:test.scope:test.metric:test.aggregator:test.namespace"
+EXPECT_WITH_NAMESPACE_RANGE = "-1d:-0d:test.scope:test.metric:test.aggregator:test.namespace"
+EXPECT_ANNOTATION_ST_ONLY = "-1d:test.scope:test.metric:test.source"
+EXPECT_ANNOTATION_TIME_RANGE = "-1d:-0d:test.scope:test.metric:test.source"
+EXPECT_ANNOTATION_WITH_TAGS = "-1d:test.scope:test.metric{test.tag=test.value}:test.source"
+#: The expected query parameters for the start-time-only metric query.
+EXPECTED_QP_ST = {"expression": EXPECT_ST_ONLY}
 
-class TestMetricQuery(unittest.TestCase):
-    def testSimpleStTimeOnly(self):
-        self.assertEqual(str(MetricQuery(scope, metric, aggregator, stTimeSpec=stTime)), "-1d:test.scope:test.metric:test.aggregator")
-        self.assertEqual(MetricQuery(scope, metric, aggregator, stTimeSpec=stTime).getQueryParams(), dict(expression="-1d:test.scope:test.metric:test.aggregator"))
 
-    def testSimpleTimeRange(self):
-        self.assertEqual(str(MetricQuery(scope, metric, aggregator, stTimeSpec=stTime, enTimeSpec=enTime)), "-1d:-0d:test.scope:test.metric:test.aggregator")
+#: Optional MetricQuery arguments and the expression they are expected to produce.
+METRIC_QUERIES = (
+    (dict(stTimeSpec=stTime), EXPECT_ST_ONLY),
+    (dict(stTimeSpec=stTime, enTimeSpec=enTime), EXPECT_TIME_RANGE),
+    (dict(stTimeSpec=stTime, tags=TAGS), EXPECT_WITH_TAGS),
+    (dict(namespace=namespace, stTimeSpec=stTime), EXPECT_WITH_NAMESPACE),
+    (dict(namespace=namespace, stTimeSpec=stTime, enTimeSpec=enTime), EXPECT_WITH_NAMESPACE_RANGE),
+)
 
-    def testNoTimeError(self):
-        self.assertRaises(AssertionError, lambda: MetricQuery(scope, metric, aggregator))
 
-    def testWithTags(self):
-        self.assertEqual(str(MetricQuery(scope, metric, aggregator, stTimeSpec=stTime, tags=tags)), "-1d:test.scope:test.metric{test.tag=test.value}:test.aggregator")
+#: Optional AnnotationQuery arguments and the expression they are expected to produce.
+ANNOTATION_QUERIES = (
+    (dict(stTimeSpec=stTime), EXPECT_ANNOTATION_ST_ONLY),
+    (dict(stTimeSpec=stTime, enTimeSpec=enTime), EXPECT_ANNOTATION_TIME_RANGE),
+    (dict(stTimeSpec=stTime, tags=TAGS), EXPECT_ANNOTATION_WITH_TAGS),
+)
 
-    def testWithNamespace(self):
-        self.assertEqual(str(MetricQuery(scope, metric, aggregator, namespace=namespace, stTimeSpec=stTime)), "-1d:test.scope:test.metric:test.aggregator:test.namespace")
 
-    def testWithNamespace2(self):
-        self.assertEqual(str(MetricQuery(scope, metric, aggregator, namespace=namespace, stTimeSpec=stTime, enTimeSpec=enTime)), "-1d:-0d:test.scope:test.metric:test.aggregator:test.namespace")
+class QueryTestMixin(object):
+    """
+    The tests shared by both query types. They only differ in the trailing parameter, which is the aggregator for
+    metric queries and the source for annotation queries.
+    """
 
+    queryClass = None
+    tailParam = None
+    queries = ()
 
-class TestAnnotationQuery(unittest.TestCase):
-    def testSimpleStTimeOnly(self):
-        self.assertEqual(str(AnnotationQuery(scope, metric, source, stTimeSpec=stTime)), "-1d:test.scope:test.metric:test.source")
+    def makeQuery(self, **kwargs):
+        return self.queryClass(scope, metric, self.tailParam, **kwargs)
 
-    def testSimpleTimeRange(self):
-        self.assertEqual(str(AnnotationQuery(scope, metric, source, stTimeSpec=stTime, enTimeSpec=enTime)), "-1d:-0d:test.scope:test.metric:test.source")
+    def testExpression(self):
+        for kwargs, expected in self.queries:
+            with self.subTest(expected=expected):
+                self.assertEqual(str(self.makeQuery(**kwargs)), expected)
 
     def testNoTimeError(self):
-        self.assertRaises(AssertionError, lambda: AnnotationQuery(scope, metric, source))
+        with self.assertRaises(AssertionError):
+            self.makeQuery()
+
+
+class TestMetricQuery(QueryTestMixin, unittest.TestCase):
+    queryClass = MetricQuery
+    tailParam = aggregator
+    queries = METRIC_QUERIES
+
+    @classmethod
+    def setUpClass(cls):
+        # Formatting doesn't modify a query, so the tests that don't vary the arguments share one instance.
+        cls.query = MetricQuery(scope, metric, aggregator, stTimeSpec=stTime)
+
+    def testQueryParams(self):
+        self.assertEqual(str(self.query), EXPECT_ST_ONLY)
+        self.assertEqual(self.query.getQueryParams(), EXPECTED_QP_ST)
+
 
-    def testWithTags(self):
-        self.assertEqual(str(AnnotationQuery(scope, metric, source, stTimeSpec=stTime, tags=tags)), "-1d:test.scope:test.metric{test.tag=test.value}:test.source")
+class TestAnnotationQuery(QueryTestMixin, unittest.TestCase):
+    queryClass = AnnotationQuery
+    tailParam = source
+    queries = ANNOTATION_QUERIES
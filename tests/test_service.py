@@ -4,9 +4,12 @@
 # Licensed under the BSD 3-Clause license.
 # For full license text, see LICENSE.txt file in the repo root  or https://opensource.org/licenses/BSD-3-Clause
 #
+import copy
 import json
-import os
 import unittest
+from functools import lru_cache
+
+import requests
 
 from argusclient import *
 from argusclient.client import JsonEncoder, JsonDecoder, check_success, AlertsServiceClient, PermissionsServiceClient, \
@@ -21,12 +24,49 @@ except ImportError:  # Python 3
     from unittest import mock
 
 
+#: Response bodies of the test_data fixtures, serialized once for all the tests.
+ADD_METRIC_RESULT_JSON = json.dumps(addmetricresult_D)
+METRIC_LIST_JSON = json.dumps([metric_D])
+ADD_ANNOTATION_RESULT_JSON = json.dumps(addannotationresult_D)
+ANNOTATION_LIST_JSON = json.dumps([annotation_D])
+USER_JSON = json.dumps(user_D)
+NAMESPACE_JSON = json.dumps(namespace_D)
+NAMESPACE_LIST_JSON = json.dumps([namespace_D])
+DASHBOARD_JSON = json.dumps(dashboard_D)
+DASHBOARD_LIST_JSON = json.dumps([dashboard_D])
+DASHBOARDS_JSON = json.dumps([dashboard_D, dashboard_2_D])
+DUPLICATE_DASHBOARDS_JSON = json.dumps([dashboard_D, dashboard_D])
+PERMISSION_USER_JSON = json.dumps(permission_user_D)
+ENTITY_PERMISSIONS_JSON = json.dumps({testId: [groupPermission_D, groupPermission_D], testId2: [userPermission_D], testId3: []})
+ALERT_JSON = json.dumps(alert_D)
+ALERT_LIST_JSON = json.dumps([alert_D])
+ALERTS_JSON = json.dumps([alert_D, alert_2_D])
+DUPLICATE_ALERTS_JSON = json.dumps([alert_D, alert_D])
+ALERTS_ALL_INFO_JSON = json.dumps([alert_all_info_D, alert_all_info_2_D])
+TRIGGER_JSON = json.dumps(trigger_D)
+TRIGGER_LIST_JSON = json.dumps([trigger_D])
+TRIGGERS_JSON = json.dumps([trigger_D, trigger_2_D])
+NOTIFICATION_JSON = json.dumps(notification_D)
+NOTIFICATION_LIST_JSON = json.dumps([notification_D])
+NOTIFICATIONS_JSON = json.dumps([notification_D, notification_2_D, notification_3_D])
+COMPALERT_JSON = json.dumps(compalert_D)
+CHILD_ALERT_1_JSON = json.dumps(childAlert_1)
+CHILD_ALERTS_JSON = json.dumps([childAlert_1, childAlert_2])
+CHILD_ALERT_TRIGGER_LIST_JSON = json.dumps([childAlert_trigger_1])
+COMP_ALERT_NOTIFICATION_LIST_JSON = json.dumps([compAlert_notification])
+DERIVATIVE_1_JSON = json.dumps(derivative_1_D)
+
+
 class MockRequest(object):
+    __slots__ = ("url",)
+
     def __init__(self, url):
         self.url = url
 
 
 class MockResponse(object):
+    __slots__ = ("text", "status_code", "cookies", "request", "url")
+
     def __init__(self, json_text, status_code, request=None,url=None):
         self.text = json_text
         self.status_code = status_code
@@ -38,19 +78,50 @@ class MockResponse(object):
         return json.loads(self.text, **kwargs)
 
 
+@lru_cache(maxsize=None)
+def _ep(*parts):
+    """ Returns the URL of the endpoint path made of `parts`, cached as the same few URLs are checked by most tests. """
+    return "/".join((endpoint,) + parts)
+
+
+#: URLs of the trigger and notification sub-collections of the test alert.
+TRIGGERS_URL = _ep("alerts", str(testId), "triggers")
+TRIGGER_URL = _ep("alerts", str(testId), "triggers", str(testId))
+NOTIFICATIONS_URL = _ep("alerts", str(testId), "notifications")
+NOTIFICATION_URL = _ep("alerts", str(testId), "notifications", str(testId))
+NOTIF_TRIGGERS_URL = _ep("alerts", str(testId), "notifications", str(testId), "triggers")
+NOTIF_TRIGGER_URL = _ep("alerts", str(testId), "notifications", str(testId), "triggers", str(testId))
+
+
+_fixture_objs = {}
+
+
+def fixture_obj(objClass, D):
+    """ Returns a shallow copy of ``objClass.from_dict(D)``, each fixture is converted only once. """
+    key = (objClass, id(D))
+    if key not in _fixture_objs:
+        _fixture_objs[key] = objClass.from_dict(D)
+    return copy.copy(_fixture_objs[key])
+
+
 def called_endpoints(mockObj):
-    return tuple(a[0][0] for a in mockObj.call_args_list)
+    return tuple(c.args[0] for c in mockObj.call_args_list)
+
 
 def expected_endpoints(*args):
-    return tuple(os.path.join(endpoint, p) for p in args)
+    return tuple(_ep(p) for p in args)
+
+#: Response bodies of the alert sub-collections, keyed by the last segment of their URL.
+_SUBCOLLECTION_JSON = {"triggers": TRIGGERS_JSON, "notifications": NOTIFICATIONS_JSON}
+
+
+def unauthorized(path):
+    """ Returns the response of Argus to an unauthenticated request for `path`. """
+    return MockResponse("""{ "status": 401, "message": "Unauthorized" }""", 401, request=MockRequest(path))
+
 
 def determineResponse(url, data, params, headers, timeout):
-    if 'triggers' in url:
-        return MockResponse(json.dumps([trigger_D, trigger_2_D]), 200)
-    if 'notifications' in url:
-        return MockResponse(json.dumps([notification_D, notification_2_D, notification_3_D]), 200)
-    else:
-        return MockResponse(json.dumps([alert_D, alert_2_D]), 200)
+    return MockResponse(_SUBCOLLECTION_JSON.get(url.rsplit("/", 1)[-1], ALERTS_JSON), 200)
 
 class TestCheckSuccess(unittest.TestCase):
 
@@ -58,16 +129,20 @@ class TestCheckSuccess(unittest.TestCase):
         check_success(MockResponse(json.dumps(dict(status=200)), 200), decCls=JsonDecoder)
 
     def testFailure(self):
-        self.assertRaises(ArgusException, lambda: check_success(MockResponse(json.dumps(dict(status=400)), 200), decCls=JsonDecoder))
+        with self.assertRaises(ArgusException):
+            check_success(MockResponse(json.dumps(dict(status=400)), 200), decCls=JsonDecoder)
 
     def testError(self):
-        self.assertRaises(ArgusException, lambda: check_success(MockResponse("", 500), decCls=JsonDecoder))
+        with self.assertRaises(ArgusException):
+            check_success(MockResponse("", 500), decCls=JsonDecoder)
 
     def testUnauthorized(self):
-        self.assertRaises(ArgusAuthException, lambda: check_success(MockResponse("", 401), decCls=JsonDecoder))
+        with self.assertRaises(ArgusAuthException):
+            check_success(MockResponse("", 401), decCls=JsonDecoder)
 
     def testUnexpectedEndpoint(self):
-        self.assertRaises(ArgusObjectNotFoundException, lambda: check_success(MockResponse("HTTP 404 Not Found", 404), decCls=JsonDecoder))
+        with self.assertRaises(ArgusObjectNotFoundException):
+            check_success(MockResponse("HTTP 404 Not Found", 404), decCls=JsonDecoder)
 
 
 class TestServiceBase(unittest.TestCase):
@@ -77,305 +152,378 @@ class TestServiceBase(unittest.TestCase):
         self.argus.accessToken = "something"
 
 
+class TestSession(TestServiceBase):
+    def testPoolMaxsize(self):
+        argus = ArgusServiceClient(userName, password, endpoint=endpoint, pool_maxsize=32)
+        adapter = argus.conn.get_adapter(endpoint)
+        self.assertIsInstance(adapter, requests.adapters.HTTPAdapter)
+        self.assertIs(adapter, argus.conn.get_adapter("http://test.host/argusws"))
+        self.assertEqual(adapter.poolmanager.connection_pool_kw["maxsize"], 32)
+
+    def testVerify(self):
+        self.assertTrue(self.argus.conn.verify)
+        argus = ArgusServiceClient(userName, password, endpoint=endpoint, verify="/path/to/ca-bundle.pem")
+        self.assertEqual(argus.conn.verify, "/path/to/ca-bundle.pem")
+
+    def testInjectedSession(self):
+        session = mock.Mock(spec=requests.Session)
+        session.get.return_value = MockResponse(USER_JSON, 200)
+        argus = ArgusServiceClient(userName, password, endpoint=endpoint, accessToken="something", session=session)
+        self.assertIs(argus.conn, session)
+        self.assertFalse(session.mount.called)
+        argus.login()
+        self.assertEqual((_ep("users/username/test.user"),), called_endpoints(session.get))
+
+    @mock.patch('requests.Session.get', return_value=MockResponse(USER_JSON, 200))
+    def testHeadersFollowAccessToken(self, mockGet):
+        self.argus.login()
+        self.assertEqual(mockGet.call_args[1]["headers"]["Authorization"], "Bearer something")
+        self.argus.accessToken = "other"
+        self.argus.login()
+        self.assertEqual(mockGet.call_args[1]["headers"]["Authorization"], "Bearer other")
+        self.argus.logout()
+        with mock.patch('requests.Session.post', return_value=MockResponse('{"refreshToken": "refresh", "accessToken": "access"}', 200)) as mockPost:
+            self.argus.login()
+        self.assertNotIn("Authorization", mockPost.call_args[1]["headers"])
+        self.assertEqual(mockGet.call_args[1]["headers"]["Authorization"], "Bearer access")
+
+    @mock.patch('requests.Session.get', return_value=MockResponse(USER_JSON, 200))
+    def testEndpointWithTrailingSlash(self, mockGet):
+        self.argus.endpoint = endpoint + "/"
+        self.argus.login()
+        self.assertEqual((_ep("users/username/test.user"),), called_endpoints(mockGet))
+
+
 class TestLogin(TestServiceBase):
+    @classmethod
+    def setUpClass(cls):
+        super(TestLogin, cls).setUpClass()
+        # Patch the session once for the whole class, each test only sets up the responses it needs.
+        for method in ("get", "post"):
+            patcher = mock.patch("requests.Session." + method)
+            setattr(cls, "mock" + method.capitalize(), patcher.start())
+            cls.addClassCleanup(patcher.stop)
+
     def setUp(self):
         super(TestLogin, self).setUp()
-        TestLogin.argus = self.argus # For access by mock
+        self.mockGet.reset_mock(return_value=True, side_effect=True)
+        self.mockPost.reset_mock(return_value=True, side_effect=True)
         self.argus.accessToken = None
 
     def testAuthSuccess(self):
         """A straight-forward login with valid username/password"""
-        with mock.patch('requests.Session.get', return_value=MockResponse(json.dumps(user_D), 200)) as mockGet:
-            with mock.patch('requests.Session.post', return_value=MockResponse('{"refreshToken": "refresh", "accessToken": "access"}', 200)) as mockPost:
-                res = self.argus.login()
-                self.assertTrue(isinstance(res, User))
-                self.assertEqual(res.to_dict(), user_D)
-                # Just checking to make sure the post is happening on the right endpoint.
-                self.assertEqual((os.path.join(endpoint, "v2/auth/login"),), called_endpoints(mockPost))
-                self.assertEqual((os.path.join(endpoint, "users/username/test.user"),), called_endpoints(mockGet))
-                self.assertEqual(self.argus.refreshToken, "refresh")
-                self.assertEqual(self.argus.accessToken, "access")
-                self.argus.logout()
-                self.assertEqual(self.argus.refreshToken, None)
-                self.assertEqual(self.argus.accessToken, None)
+        self.mockGet.return_value = MockResponse(USER_JSON, 200)
+        self.mockPost.return_value = MockResponse('{"refreshToken": "refresh", "accessToken": "access"}', 200)
+        res = self.argus.login()
+        self.assertTrue(isinstance(res, User))
+        self.assertEqual(res.to_dict(), user_D)
+        # Just checking to make sure the post is happening on the right endpoint.
+        self.assertEqual((_ep("v2/auth/login"),), called_endpoints(self.mockPost))
+        self.assertEqual((_ep("users/username/test.user"),), called_endpoints(self.mockGet))
+        self.assertEqual(self.argus.refreshToken, "refresh")
+        self.assertEqual(self.argus.accessToken, "access")
+        self.argus.logout()
+        self.assertEqual(self.argus.refreshToken, None)
+        self.assertEqual(self.argus.accessToken, None)
 
     def testAuthImplicit(self):
         """A straight-forward implicit login with valid username/password"""
-        with mock.patch('requests.Session.get', return_value=MockResponse(json.dumps([namespace_D]), 200)) as mockGet:
-            with mock.patch('requests.Session.post', return_value=MockResponse('{"refreshToken": "refresh", "accessToken": "access"}', 200)) as mockPost:
-                list(self.argus.namespaces.values())
-                self.assertEqual((os.path.join(endpoint, "v2/auth/login"),), called_endpoints(mockPost))
-                self.assertEqual((os.path.join(endpoint, "namespace"),), called_endpoints(mockGet))
-                self.assertEqual(self.argus.refreshToken, "refresh")
-                self.assertEqual(self.argus.accessToken, "access")
-
-    @mock.patch('requests.Session.post', return_value=MockResponse("""{ "status": 401, "message": "Unauthorized" }""", 401, request=MockRequest("v2/auth/login")))
-    def testUnauthorized(self, mockPost):
+        self.mockGet.return_value = MockResponse(NAMESPACE_LIST_JSON, 200)
+        self.mockPost.return_value = MockResponse('{"refreshToken": "refresh", "accessToken": "access"}', 200)
+        list(self.argus.namespaces.values())
+        self.assertEqual((_ep("v2/auth/login"),), called_endpoints(self.mockPost))
+        self.assertEqual((_ep("namespace"),), called_endpoints(self.mockGet))
+        self.assertEqual(self.argus.refreshToken, "refresh")
+        self.assertEqual(self.argus.accessToken, "access")
+
+    def testUnauthorized(self):
         """A straight-forward login failure with invalid username/password"""
-        self.assertRaises(ArgusAuthException, lambda: self.argus.login())
+        self.mockPost.return_value = unauthorized("v2/auth/login")
+        with self.assertRaises(ArgusAuthException):
+            self.argus.login()
+
+    def mockConn(self, gets=(), posts=()):
+        """ Patches the session of the client to answer its get and post calls with the given responses, in order. """
+        patcher = mock.patch.object(self.argus, "conn")
+        mockConn = patcher.start()
+        self.addCleanup(patcher.stop)
+        mockConn.get.side_effect = list(gets)
+        mockConn.post.side_effect = list(posts)
+        return mockConn
 
     def testAuthWithDirectRefreshToken(self):
         """Initialize directly with a valid refresh token but no access token or password"""
         self.argus.refreshToken = "refresh"
         self.argus.password = None
-        with mock.patch('test_service.TestLogin.argus.conn') as mockConn:
-            mockConn.get = mock.Mock(side_effect=[
-                MockResponse(json.dumps([namespace_D]), 200),
-            ])
-            mockConn.post = mock.Mock(side_effect=[
-                MockResponse('{"accessToken": "access"}', 200)
-            ])
-            list(self.argus.namespaces.values())
-            self.assertEqual((os.path.join(endpoint, "namespace"),), called_endpoints(mockConn.get))
-            self.assertEqual(1, mockConn.get.call_count)
-            self.assertEqual((os.path.join(endpoint, "v2/auth/token/refresh"),), called_endpoints(mockConn.post))
-            self.assertEqual(1, mockConn.post.call_count)
+        mockConn = self.mockConn(gets=[MockResponse(NAMESPACE_LIST_JSON, 200)],
+                                 posts=[MockResponse('{"accessToken": "access"}', 200)])
+        list(self.argus.namespaces.values())
+        self.assertEqual((_ep("namespace"),), called_endpoints(mockConn.get))
+        self.assertEqual(1, mockConn.get.call_count)
+        self.assertEqual((_ep("v2/auth/token/refresh"),), called_endpoints(mockConn.post))
+        self.assertEqual(1, mockConn.post.call_count)
 
     def testAuthWithDirectAccessToken(self):
         """Initialize directly with a valid access token but no password or refresh token to refresh"""
         self.argus.accessToken = "access"
         self.argus.password = None
-        with mock.patch('test_service.TestLogin.argus.conn') as mockConn:
-            mockConn.get = mock.Mock(return_value=MockResponse(json.dumps([namespace_D]), 200))
-            list(self.argus.namespaces.values())
-            self.assertEqual((os.path.join(endpoint, "namespace"),), called_endpoints(mockConn.get))
-            self.assertEqual(1, mockConn.get.call_count)
+        mockConn = self.mockConn(gets=[MockResponse(NAMESPACE_LIST_JSON, 200)])
+        list(self.argus.namespaces.values())
+        self.assertEqual((_ep("namespace"),), called_endpoints(mockConn.get))
+        self.assertEqual(1, mockConn.get.call_count)
 
     def testAuthRefreshAccessToken(self):
         """Test ability to refresh access token from refresh token"""
         self.argus.accessToken = "access"
         self.argus.refreshToken = "refresh"
-        with mock.patch('test_service.TestLogin.argus.conn') as mockConn:
-            mockConn.get = mock.Mock(side_effect=[
-                MockResponse("""{ "status": 401, "message": "Unauthorized" }""", 401, request=MockRequest("namespace")),
-                MockResponse(json.dumps([namespace_D]), 200)
-            ])
-            mockConn.post = mock.Mock(return_value=MockResponse('{"accessToken": "access2"}', 200))
-            list(self.argus.namespaces.values())
-            self.assertEqual((os.path.join(endpoint, "v2/auth/token/refresh"),), called_endpoints(mockConn.post))
-            self.assertEqual(1, mockConn.post.call_count)
-            self.assertEqual((os.path.join(endpoint, "namespace"), os.path.join(endpoint, "namespace"),), called_endpoints(mockConn.get))
-            self.assertEqual(2, mockConn.get.call_count)
-            self.assertEqual(self.argus.refreshToken, "refresh")
-            self.assertEqual(self.argus.accessToken, "access2")
+        mockConn = self.mockConn(gets=[unauthorized("namespace"), MockResponse(NAMESPACE_LIST_JSON, 200)],
+                                 posts=[MockResponse('{"accessToken": "access2"}', 200)])
+        list(self.argus.namespaces.values())
+        self.assertEqual((_ep("v2/auth/token/refresh"),), called_endpoints(mockConn.post))
+        self.assertEqual(1, mockConn.post.call_count)
+        self.assertEqual((_ep("namespace"), _ep("namespace"),), called_endpoints(mockConn.get))
+        self.assertEqual(2, mockConn.get.call_count)
+        self.assertEqual(self.argus.refreshToken, "refresh")
+        self.assertEqual(self.argus.accessToken, "access2")
 
     def testAuthRefreshRefreshToken(self):
         """Test ability to refresh refresh token from username/password"""
         self.argus.accessToken = "access"
         self.argus.refreshToken = "refresh"
-        with mock.patch('test_service.TestLogin.argus.conn') as mockConn:
-            mockConn.get = mock.Mock(side_effect=[
-                MockResponse("""{ "status": 401, "message": "Unauthorized" }""", 401, request=MockRequest("namespace")),
-                MockResponse(json.dumps([namespace_D]), 200)
-            ])
-            mockConn.post = mock.Mock(side_effect=[
-                MockResponse("""{ "status": 401, "message": "Unauthorized" }""", 401, request=MockRequest("v2/auth/refresh/token")),
-                MockResponse('{"refreshToken": "refresh2", "accessToken": "access2"}', 200)
-            ])
-            list(self.argus.namespaces.values())
-            self.assertEqual((os.path.join(endpoint, "v2/auth/token/refresh"),os.path.join(endpoint, "v2/auth/login"),), called_endpoints(mockConn.post))
-            self.assertEqual(2, mockConn.post.call_count)
-            self.assertEqual((os.path.join(endpoint, "namespace"), os.path.join(endpoint, "namespace"),), called_endpoints(mockConn.get))
-            self.assertEqual(2, mockConn.get.call_count)
-            self.assertEqual(self.argus.refreshToken, "refresh2")
-            self.assertEqual(self.argus.accessToken, "access2")
+        mockConn = self.mockConn(gets=[unauthorized("namespace"), MockResponse(NAMESPACE_LIST_JSON, 200)],
+                                 posts=[unauthorized("v2/auth/refresh/token"),
+                                        MockResponse('{"refreshToken": "refresh2", "accessToken": "access2"}', 200)])
+        list(self.argus.namespaces.values())
+        self.assertEqual((_ep("v2/auth/token/refresh"),_ep("v2/auth/login"),), called_endpoints(mockConn.post))
+        self.assertEqual(2, mockConn.post.call_count)
+        self.assertEqual((_ep("namespace"), _ep("namespace"),), called_endpoints(mockConn.get))
+        self.assertEqual(2, mockConn.get.call_count)
+        self.assertEqual(self.argus.refreshToken, "refresh2")
+        self.assertEqual(self.argus.accessToken, "access2")
 
     def testInvalidRefreshTokenWithDirectAccessToken(self):
         """Test inability to refresh access token if refresh token is invalid and there is no password"""
         self.argus.accessToken = "access"
         self.argus.password = None
-        with mock.patch('test_service.TestLogin.argus.conn') as mockConn:
-            mockConn.get = mock.Mock(side_effect=[
-                MockResponse(json.dumps([namespace_D]), 200),
-                MockResponse("""{ "status": 401, "message": "Unauthorized" }""", 401, request=MockRequest("namespace")),
-                MockResponse("""{ "status": 401, "message": "Unauthorized" }""", 401, request=MockRequest("namespace")),
-            ])
+        mockConn = self.mockConn(gets=[MockResponse(NAMESPACE_LIST_JSON, 200),
+                                       unauthorized("namespace"), unauthorized("namespace")])
+        list(self.argus.namespaces.values())
+        self.assertEqual((_ep("namespace"),), called_endpoints(mockConn.get))
+        self.assertEqual(1, mockConn.get.call_count)
+        self.argus.namespaces._retrieved_all = False
+        with self.assertRaises(ArgusAuthException):
             list(self.argus.namespaces.values())
-            self.assertEqual((os.path.join(endpoint, "namespace"),), called_endpoints(mockConn.get))
-            self.assertEqual(1, mockConn.get.call_count)
-            self.argus.namespaces._retrieved_all = False
-            self.assertRaises(ArgusAuthException, lambda: list(self.argus.namespaces.values()))
-            self.assertEqual((os.path.join(endpoint, "namespace"), os.path.join(endpoint, "namespace"), os.path.join(endpoint, "namespace"),), called_endpoints(mockConn.get))
-            self.assertEqual(3, mockConn.get.call_count)
+        self.assertEqual((_ep("namespace"), _ep("namespace"), _ep("namespace"),), called_endpoints(mockConn.get))
+        self.assertEqual(3, mockConn.get.call_count)
 
     def testInvalidPasswordWithDirectRefreshToken(self):
         """Test inability to refresh refresh token as there is no password"""
         self.argus.refreshToken = "refresh"
         self.argus.password = None
-        with mock.patch('test_service.TestLogin.argus.conn') as mockConn:
-            mockConn.get = mock.Mock(side_effect=[
-                MockResponse(json.dumps([namespace_D]), 200),
-                MockResponse("""{ "status": 401, "message": "Unauthorized" }""", 401, request=MockRequest("namespace")),
-            ])
-            mockConn.post = mock.Mock(side_effect=[
-                MockResponse('{"accessToken": "access"}', 200),
-                MockResponse("""{ "status": 401, "message": "Unauthorized" }""", 401, request=MockRequest("namespace")),
-            ])
+        mockConn = self.mockConn(gets=[MockResponse(NAMESPACE_LIST_JSON, 200), unauthorized("namespace")],
+                                 posts=[MockResponse('{"accessToken": "access"}', 200), unauthorized("namespace")])
+        list(self.argus.namespaces.values())
+        self.assertEqual((_ep("namespace"),), called_endpoints(mockConn.get))
+        self.assertEqual(1, mockConn.get.call_count)
+        self.assertEqual((_ep("v2/auth/token/refresh"),), called_endpoints(mockConn.post))
+        self.assertEqual(1, mockConn.post.call_count)
+        self.argus.namespaces._retrieved_all = False
+        with self.assertRaises(ArgusAuthException):
             list(self.argus.namespaces.values())
-            self.assertEqual((os.path.join(endpoint, "namespace"),), called_endpoints(mockConn.get))
-            self.assertEqual(1, mockConn.get.call_count)
-            self.assertEqual((os.path.join(endpoint, "v2/auth/token/refresh"),), called_endpoints(mockConn.post))
-            self.assertEqual(1, mockConn.post.call_count)
-            self.argus.namespaces._retrieved_all = False
-            self.assertRaises(ArgusAuthException, lambda: list(self.argus.namespaces.values()))
-            self.assertEqual((os.path.join(endpoint, "v2/auth/token/refresh"), os.path.join(endpoint, "v2/auth/token/refresh"),), called_endpoints(mockConn.post))
-            self.assertEqual(2, mockConn.post.call_count)
+        self.assertEqual((_ep("v2/auth/token/refresh"), _ep("v2/auth/token/refresh"),), called_endpoints(mockConn.post))
+        self.assertEqual(2, mockConn.post.call_count)
 
     def testExpiredPassword(self):
         """Test inability to refresh tokens due to expired password"""
-        with mock.patch('test_service.TestLogin.argus.conn') as mockConn:
-            mockConn.get = mock.Mock(side_effect=[
-                MockResponse(json.dumps([namespace_D]), 200),
-                MockResponse("""{ "status": 401, "message": "Unauthorized" }""", 401, request=MockRequest("namespace")),
-            ])
-            mockConn.post = mock.Mock(side_effect=[
-                MockResponse('{"refreshToken": "refresh", "accessToken": "access"}', 200),
-                MockResponse("""{ "status": 401, "message": "Unauthorized" }""", 401, request=MockRequest("namespace")),
-                MockResponse("""{ "status": 401, "message": "Unauthorized" }""", 401, request=MockRequest("namespace")),
-            ])
+        mockConn = self.mockConn(gets=[MockResponse(NAMESPACE_LIST_JSON, 200), unauthorized("namespace")],
+                                 posts=[MockResponse('{"refreshToken": "refresh", "accessToken": "access"}', 200),
+                                        unauthorized("namespace"), unauthorized("namespace")])
+        list(self.argus.namespaces.values())
+        self.assertEqual(1, mockConn.get.call_count)
+        self.assertEqual(expected_endpoints("namespace"), called_endpoints(mockConn.get))
+        self.assertEqual(1, mockConn.post.call_count)
+        self.assertEqual(expected_endpoints("v2/auth/login"), called_endpoints(mockConn.post))
+        self.argus.namespaces._retrieved_all = False
+        with self.assertRaises(ArgusAuthException):
             list(self.argus.namespaces.values())
-            self.assertEqual(1, mockConn.get.call_count)
-            self.assertEqual(expected_endpoints("namespace"), called_endpoints(mockConn.get))
-            self.assertEqual(1, mockConn.post.call_count)
-            self.assertEqual(expected_endpoints("v2/auth/login"), called_endpoints(mockConn.post))
-            self.argus.namespaces._retrieved_all = False
-            self.assertRaises(ArgusAuthException, lambda: list(self.argus.namespaces.values()))
-            self.assertEqual(2, mockConn.get.call_count)
-            self.assertEqual(expected_endpoints("namespace", "namespace"), called_endpoints(mockConn.get))
-            self.assertEqual(3, mockConn.post.call_count)
-            self.assertEqual(expected_endpoints("v2/auth/login", "v2/auth/token/refresh", "v2/auth/login"), called_endpoints(mockConn.post))
+        self.assertEqual(2, mockConn.get.call_count)
+        self.assertEqual(expected_endpoints("namespace", "namespace"), called_endpoints(mockConn.get))
+        self.assertEqual(3, mockConn.post.call_count)
+        self.assertEqual(expected_endpoints("v2/auth/login", "v2/auth/token/refresh", "v2/auth/login"), called_endpoints(mockConn.post))
 
 class TestMetrics(TestServiceBase):
     def testAddInvalidMetrics(self):
-        self.assertRaises(TypeError, lambda: self.argus.metrics.add(Metric.from_dict(metric_D)))
-        self.assertRaises(TypeError, lambda: self.argus.metrics.add([dict()]))
-        self.assertRaises(ValueError, lambda: self.argus.metrics.add([]))
-
-    @mock.patch('requests.Session.post', return_value=MockResponse(json.dumps(addmetricresult_D), 200))
+        with self.assertRaises(TypeError):
+            self.argus.metrics.add(Metric.from_dict(metric_D))
+        with self.assertRaises(TypeError):
+            self.argus.metrics.add([dict()])
+        with self.assertRaises(ValueError):
+            self.argus.metrics.add([])
+
+    @mock.patch('requests.Session.post', return_value=MockResponse(ADD_METRIC_RESULT_JSON, 200))
     def testAddMetrics(self, mockPost):
         res = self.argus.metrics.add([Metric.from_dict(metric_D)])
         self.assertTrue(isinstance(res, AddListResult))
-        self.assertIn((os.path.join(endpoint, "collection/metrics"),), tuple(mockPost.call_args))
-
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps([metric_D]), 200))
+        self.assertEqual(mockPost.call_args.args[0], _ep("collection/metrics"))
+
+    @mock.patch('requests.Session.post', return_value=MockResponse(ADD_METRIC_RESULT_JSON, 200))
+    def testAddMetricsBody(self, mockPost):
+        """Int timestamps are sent as string keys, and non-finite values as json writes them"""
+        m = Metric.from_dict(metric_D)
+        m.datapoints = {1: float("nan"), 2: 2.5}
+        self.argus.metrics.add([m])
+        data = mockPost.call_args.kwargs["data"]
+        self.assertIsInstance(data, str)
+        self.assertIn('"datapoints": {"1": NaN, "2": 2.5}', data)
+
+    @mock.patch('requests.Session.get', return_value=MockResponse(METRIC_LIST_JSON, 200))
     def testGetMetrics(self, mockGet):
         res = self.argus.metrics.query(MetricQuery(scope, metric, aggregator, stTimeSpec="-1d"))
         self.assertTrue(isinstance(res, list))
         self.assertEqual(len(res), 1)
         self.assertTrue(isinstance(res[0], Metric))
         self.assertEqual(res[0].to_dict(), metric_D)
-        self.assertIn((os.path.join(endpoint, "metrics"),), tuple(mockGet.call_args))
+        self.assertEqual(mockGet.call_args.args[0], _ep("metrics"))
 
 
 class TestAnnotations(TestServiceBase):
     def testAddInvalidAnnotations(self):
-        self.assertRaises(TypeError, lambda: self.argus.annotations.add(Annotation.from_dict(annotation_D)))
-        self.assertRaises(TypeError, lambda: self.argus.annotations.add([dict()]))
-        self.assertRaises(ValueError, lambda: self.argus.annotations.add([]))
-
-    @mock.patch('requests.Session.post', return_value=MockResponse(json.dumps(addannotationresult_D), 200))
+        with self.assertRaises(TypeError):
+            self.argus.annotations.add(Annotation.from_dict(annotation_D))
+        with self.assertRaises(TypeError):
+            self.argus.annotations.add([dict()])
+        with self.assertRaises(ValueError):
+            self.argus.annotations.add([])
+
+    @mock.patch('requests.Session.post', return_value=MockResponse(ADD_ANNOTATION_RESULT_JSON, 200))
     def testAddAnnotations(self, mockPost):
         res = self.argus.annotations.add([Annotation.from_dict(annotation_D)])
         self.assertTrue(isinstance(res, AddListResult))
-        self.assertIn((os.path.join(endpoint, "collection/annotations"),), tuple(mockPost.call_args))
+        self.assertEqual(mockPost.call_args.args[0], _ep("collection/annotations"))
 
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps([annotation_D]), 200))
+    @mock.patch('requests.Session.get', return_value=MockResponse(ANNOTATION_LIST_JSON, 200))
     def testGetAnnotations(self, mockGet):
         res = self.argus.annotations.query(AnnotationQuery(scope, metric, source, stTimeSpec="-1d"))
         self.assertTrue(isinstance(res, list))
         self.assertEqual(len(res), 1)
         self.assertTrue(isinstance(res[0], Annotation))
         self.assertEqual(res[0].to_dict(), annotation_D)
-        self.assertIn((os.path.join(endpoint, "annotations"),), tuple(mockGet.call_args))
+        self.assertEqual(mockGet.call_args.args[0], _ep("annotations"))
 
 
 class TestUser(TestServiceBase):
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps(user_D), 200))
+    @mock.patch('requests.Session.get', return_value=MockResponse(USER_JSON, 200))
     def testGetUserById(self, mockGet):
         res = self.argus.users.get(testId)
         self.assertTrue(isinstance(res, User))
         self.assertEqual(res.to_dict(), user_D)
-        self.assertIn((os.path.join(endpoint, "users/id", str(testId)),), tuple(mockGet.call_args))
+        self.assertEqual(mockGet.call_args.args[0], _ep("users/id", str(testId)))
 
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps(user_D), 200))
+    @mock.patch('requests.Session.get', return_value=MockResponse(USER_JSON, 200))
     def testGetUserByUsername(self, mockGet):
         res = self.argus.users.get(userName)
         self.assertTrue(isinstance(res, User))
         self.assertEqual(res.to_dict(), user_D)
-        self.assertIn((os.path.join(endpoint, "users/username", userName),), tuple(mockGet.call_args))
+        self.assertEqual(mockGet.call_args.args[0], _ep("users/username", userName))
+
+
+#: (collection, entity class, fixture, entity id, response body) of the service clients sharing the same CRUD methods.
+CRUD_CASES = (
+    ("dashboards", Dashboard, dashboard_D, testId, DASHBOARD_JSON),
+    ("alerts", Alert, alert_D, testId, ALERT_JSON),
+    ("derivatives", Derivative, derivative_1_D, derivativeID_1, DERIVATIVE_1_JSON),
+)
+
+
+class TestCrud(TestServiceBase):
+    @mock.patch('requests.Session.post')
+    def testAdd(self, mockPost):
+        for name, objClass, D, objId, body in CRUD_CASES:
+            with self.subTest(name=name):
+                mockPost.return_value = MockResponse(body, 200)
+                obj = fixture_obj(objClass, D)
+                delattr(obj, "id")
+                res = getattr(self.argus, name).add(obj)
+                self.assertTrue(isinstance(res, objClass))
+                self.assertTrue(hasattr(res, "id"))
+                self.assertEqual(mockPost.call_args.args[0], _ep(name))
+
+    @mock.patch('requests.Session.put')
+    def testUpdate(self, mockPut):
+        for name, objClass, D, objId, body in CRUD_CASES:
+            with self.subTest(name=name):
+                mockPut.return_value = MockResponse(body, 200)
+                coll = getattr(self.argus, name)
+                coll.update(objId, fixture_obj(objClass, D))
+                self.assertTrue(isinstance(coll.get(objId), objClass))
+                self.assertEqual(coll.get(objId).to_dict(), D)
+                self.assertEqual(mockPut.call_args.args[0], _ep(name, str(objId)))
+
+    @mock.patch('requests.Session.get')
+    def testGet(self, mockGet):
+        for name, objClass, D, objId, body in CRUD_CASES:
+            with self.subTest(name=name):
+                mockGet.return_value = MockResponse(body, 200)
+                res = getattr(self.argus, name).get(objId)
+                self.assertTrue(isinstance(res, objClass))
+                self.assertEqual(res.to_dict(), D)
+                self.assertEqual(mockGet.call_args.args[0], _ep(name, str(objId)))
+
+    @mock.patch('requests.Session.delete', return_value=MockResponse("", 200))
+    def testDelete(self, mockDelete):
+        for name, objClass, D, objId, body in CRUD_CASES:
+            with self.subTest(name=name):
+                getattr(self.argus, name).delete(objId)
+                self.assertEqual(mockDelete.call_args.args[0], _ep(name, str(objId)))
 
 
 class TestDashboard(TestServiceBase):
     def testAddInvalidDashboard(self):
-        self.assertRaises(TypeError, lambda: self.argus.dashboards.add(dict()))
-        self.assertRaises(ValueError, lambda: self.argus.dashboards.add(Dashboard.from_dict(dashboard_D)))
+        with self.assertRaises(TypeError):
+            self.argus.dashboards.add(dict())
+        with self.assertRaises(ValueError):
+            self.argus.dashboards.add(fixture_obj(Dashboard, dashboard_D))
 
     def testGetDashboardNoId(self):
-        self.assertRaises(ValueError, lambda: self.argus.dashboards.get(None))
-
-    @mock.patch('requests.Session.post', return_value=MockResponse(json.dumps(dashboard_D), 200))
-    def testAddDashboard(self, mockPost):
-        dashboard = Dashboard.from_dict(dashboard_D)
-        delattr(dashboard, "id")
-        res = self.argus.dashboards.add(dashboard)
-        self.assertTrue(isinstance(res, Dashboard))
-        self.assertTrue(hasattr(res, "id"))
-        self.assertIn((os.path.join(endpoint, "dashboards"),), tuple(mockPost.call_args))
-
-    @mock.patch('requests.Session.put', return_value=MockResponse(json.dumps(dashboard_D), 200))
-    def testUpdateDashboard(self, mockPut):
-        self.argus.dashboards.update(testId, Dashboard.from_dict(dashboard_D))
-        self.assertTrue(isinstance(self.argus.dashboards.get(testId), Dashboard))
-        self.assertEqual(self.argus.dashboards.get(testId).to_dict(), dashboard_D)
-        self.assertIn((os.path.join(endpoint, "dashboards", str(testId)),), tuple(mockPut.call_args))
-
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps(dashboard_D), 200))
-    def testGetDashboard(self, mockGet):
-        res = self.argus.dashboards.get(testId)
-        self.assertTrue(isinstance(res, Dashboard))
-        self.assertEqual(res.to_dict(), dashboard_D)
-        self.assertIn((os.path.join(endpoint, "dashboards", str(testId)),), tuple(mockGet.call_args))
-
-    @mock.patch('requests.Session.delete', return_value=MockResponse("", 200))
-    def testDeleteDashboard(self, mockDelete):
-        self.argus.dashboards.delete(testId)
-        self.assertIn((os.path.join(endpoint, "dashboards", str(testId)),), tuple(mockDelete.call_args))
+        with self.assertRaises(ValueError):
+            self.argus.dashboards.get(None)
 
     @mock.patch('requests.Session.get', return_value=MockResponse("[]", 200))
     def testGetUserDashboardNonExisting(self, mockGet):
         res = self.argus.dashboards.get_user_dashboard(userName, dashboardName)
         self.assertTrue(res is None)
 
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps([dashboard_D]), 200))
+    @mock.patch('requests.Session.get', return_value=MockResponse(DASHBOARD_LIST_JSON, 200))
     def testGetUserDashboard(self, mockGet):
         res = self.argus.dashboards.get_user_dashboard(userName, dashboardName)
         self.assertTrue(res is not None)
         self.assertEqual(res.to_dict(), dashboard_D)
-        self.assertIn((os.path.join(endpoint, "dashboards"),), tuple(mockGet.call_args))
+        self.assertEqual(mockGet.call_args.args[0], _ep("dashboards"))
 
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps([dashboard_D, dashboard_D]), 200))
+    @mock.patch('requests.Session.get', return_value=MockResponse(DUPLICATE_DASHBOARDS_JSON, 200))
     def testGetUserDashboardMultipleUnexpected(self, mockGet):
-        self.assertRaises(AssertionError, lambda: self.argus.dashboards.get_user_dashboard(userName, dashboardName))
+        with self.assertRaises(AssertionError):
+            self.argus.dashboards.get_user_dashboard(userName, dashboardName)
 
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps([dashboard_D, dashboard_D]), 200))
+    @mock.patch('requests.Session.get', return_value=MockResponse(DUPLICATE_DASHBOARDS_JSON, 200))
     def testGetUserDashboards(self, mockGet):
         res = self.argus.dashboards.get_user_dashboards(userName)
         self.assertTrue(res is not None)
         for obj in res:
             self.assertTrue(isinstance(obj, Dashboard))
             self.assertEqual(obj.to_dict(), dashboard_D)
-        self.assertIn((os.path.join(endpoint, "dashboards"),), tuple(mockGet.call_args))
+        self.assertEqual(mockGet.call_args.args[0], _ep("dashboards"))
 
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps([dashboard_D, dashboard_2_D]), 200))
+    @mock.patch('requests.Session.get', return_value=MockResponse(DASHBOARDS_JSON, 200))
     def testGetItems(self, mockGet):
         # Check
         self.assertEqual(len(mockGet.call_args_list), 0)
 
         # Arrange
-        self.argus.dashboards = DashboardsServiceClient(self.argus, get_all_req_opts=dict(REQ_PARAMS=dict(shared=False)))
+        dashboards = DashboardsServiceClient(self.argus, get_all_req_opts=dict(REQ_PARAMS=dict(shared=False)))
 
         # Act
-        res = list(self.argus.dashboards.items())
+        res = list(dashboards.items())
 
         # Assert
         self.assertTrue(res is not None)
@@ -387,7 +535,7 @@ class TestDashboard(TestServiceBase):
             elif id == testId2:
                 self.assertEqual(obj.to_dict(), dashboard_2_D)
 
-        self.assertIn((os.path.join(endpoint, "dashboards"),), tuple(mockGet.call_args))
+        self.assertEqual(mockGet.call_args.args[0], _ep("dashboards"))
         self.assertEqual(len(mockGet.call_args_list), 1)
 
 
@@ -396,29 +544,26 @@ class TestPermission(TestServiceBase):
     def testGetPermissionsBadId(self, mockPost):
         res = self.argus.permissions.get_permissions_for_entities([testId])
         self.assertEqual(len(res), 0)
-        self.assertIn((os.path.join(endpoint, "permission/entityIds"),), tuple(mockPost.call_args))
+        self.assertEqual(mockPost.call_args.args[0], _ep("permission/entityIds"))
 
-    @mock.patch('requests.Session.post', return_value=MockResponse(json.dumps({testId: [groupPermission_D, groupPermission_D],
-                                                                               testId2: [userPermission_D],
-                                                                               testId3: []}), 200))
+    @mock.patch('requests.Session.post', return_value=MockResponse(ENTITY_PERMISSIONS_JSON, 200))
     def testGetItems(self, mockPost):
         # Check
         self.assertEqual(len(mockPost.call_args_list), 0)
 
         # Arrange
         all_perms_path = "entityIds"
-        self.argus.permissions = PermissionsServiceClient(self.argus, get_all_req_opts={REQ_PARAMS: dict(shared=False),
-                                                                              REQ_PATH: all_perms_path,
-                                                                              REQ_METHOD: "post",
-                                                                              REQ_BODY: [testId, testId2, testId3]})
-        client = self.argus.permissions
+        client = PermissionsServiceClient(self.argus, get_all_req_opts={REQ_PARAMS: dict(shared=False),
+                                                                        REQ_PATH: all_perms_path,
+                                                                        REQ_METHOD: "post",
+                                                                        REQ_BODY: [testId, testId2, testId3]})
 
         # Act
         res = list(client.items())
 
         # Assert
         self.assertEqual(len(mockPost.call_args_list), 1)
-        self.assertIn((os.path.join(endpoint, "permission/"+all_perms_path),), tuple(mockPost.call_args))
+        self.assertEqual(mockPost.call_args.args[0], _ep("permission/"+all_perms_path))
         self.assertEqual(len(res), 3)
 
         for id, obj in res:
@@ -437,166 +582,165 @@ class TestPermission(TestServiceBase):
         self.assertEqual(len(mockPost.call_args_list), 1)
 
 
-    @mock.patch('requests.Session.post', return_value=MockResponse(json.dumps({testId: [groupPermission_D, groupPermission_D],
-                                                                               testId2: [userPermission_D],
-                                                                               testId3: []}), 200))
+    @mock.patch('requests.Session.post', return_value=MockResponse(ENTITY_PERMISSIONS_JSON, 200))
     def testGetPermissions(self, mockPost):
         resp = self.argus.permissions.get_permissions_for_entities([testId, testId2, testId3])
         for id, perms in list(resp.items()):
             for p in perms:
                 self.assertTrue(isinstance(p, Permission))
-        self.assertIn((os.path.join(endpoint, "permission/entityIds"),), tuple(mockPost.call_args))
+        self.assertEqual(mockPost.call_args.args[0], _ep("permission/entityIds"))
 
     def testAddInvalidPermission(self):
-        self.assertRaises(TypeError, lambda: self.argus.permissions.add(entity_id, dict()))
-        self.assertRaises(ValueError, lambda: self.argus.permissions.add(entity_id, Permission.from_dict(permission_user_D)))
+        with self.assertRaises(TypeError):
+            self.argus.permissions.add(entity_id, dict())
+        with self.assertRaises(ValueError):
+            self.argus.permissions.add(entity_id, fixture_obj(Permission, permission_user_D))
 
-    @mock.patch('requests.Session.post', return_value=MockResponse(json.dumps(permission_user_D), 200))
+    @mock.patch('requests.Session.post', return_value=MockResponse(PERMISSION_USER_JSON, 200))
     def testAddPermission(self, mockPost):
-        user_permission = Permission.from_dict(permission_user_D)
+        user_permission = fixture_obj(Permission, permission_user_D)
         delattr(user_permission, "id")
         res = self.argus.permissions.add(testId, user_permission)
         self.assertTrue(isinstance(res, Permission))
         self.assertTrue(hasattr(res, "id"))
-        self.assertIn((os.path.join(endpoint, "permission", str(testId)),), tuple(mockPost.call_args))
+        self.assertEqual(mockPost.call_args.args[0], _ep("permission", str(testId)))
         self.assertEqual(self.argus.permissions[testId].argus_id, testId)
 
-    @mock.patch('requests.Session.delete', return_value=MockResponse(json.dumps(permission_user_D), 200))
+    @mock.patch('requests.Session.delete', return_value=MockResponse(PERMISSION_USER_JSON, 200))
     def testDeletePermission(self, mockDelete):
-        self.argus.permissions.delete(testId, Permission.from_dict(permission_user_D))
-        self.assertIn((os.path.join(endpoint, "permission", str(testId)),), tuple(mockDelete.call_args))
+        self.argus.permissions.delete(testId, fixture_obj(Permission, permission_user_D))
+        self.assertEqual(mockDelete.call_args.args[0], _ep("permission", str(testId)))
 
 
 class TestNamespace(TestServiceBase):
     def testAddInvalidNamespace(self):
-        self.assertRaises(TypeError, lambda: self.argus.namespaces.add(dict()))
-        self.assertRaises(ValueError, lambda: self.argus.namespaces.add(Namespace.from_dict(namespace_D)))
+        with self.assertRaises(TypeError):
+            self.argus.namespaces.add(dict())
+        with self.assertRaises(ValueError):
+            self.argus.namespaces.add(fixture_obj(Namespace, namespace_D))
 
-    @mock.patch('requests.Session.post', return_value=MockResponse(json.dumps(namespace_D), 200))
+    @mock.patch('requests.Session.post', return_value=MockResponse(NAMESPACE_JSON, 200))
     def testAddNamespace(self, mockPost):
-        namespace = Namespace.from_dict(namespace_D)
+        namespace = fixture_obj(Namespace, namespace_D)
         delattr(namespace, "id")
         res = self.argus.namespaces.add(namespace)
         self.assertTrue(isinstance(res, Namespace))
         self.assertTrue(hasattr(res, "id"))
-        self.assertIn((os.path.join(endpoint, "namespace"),), tuple(mockPost.call_args))
+        self.assertEqual(mockPost.call_args.args[0], _ep("namespace"))
 
-    @mock.patch('requests.Session.put', return_value=MockResponse(json.dumps(namespace_D), 200))
+    @mock.patch('requests.Session.put', return_value=MockResponse(NAMESPACE_JSON, 200))
     def testUpdateNamespace(self, mockPut):
-        self.argus.namespaces.update(testId, Namespace.from_dict(namespace_D))
+        self.argus.namespaces.update(testId, fixture_obj(Namespace, namespace_D))
         self.assertTrue(isinstance(self.argus.namespaces.get(testId), Namespace))
         self.assertEqual(self.argus.namespaces.get(testId).to_dict(), namespace_D)
-        self.assertIn((os.path.join(endpoint, "namespace", str(testId)),), tuple(mockPut.call_args))
+        self.assertEqual(mockPut.call_args.args[0], _ep("namespace", str(testId)))
 
-    @mock.patch('requests.Session.put', return_value=MockResponse(json.dumps(namespace_D), 200))
+    @mock.patch('requests.Session.put', return_value=MockResponse(NAMESPACE_JSON, 200))
     def testUpdateNamespaceUsers(self, mockPut):
         res = self.argus.namespaces.update_users(testId, userName)
         self.assertTrue(isinstance(res, Namespace))
         self.assertEqual(res.to_dict(), namespace_D)
-        self.assertIn((os.path.join(endpoint, "namespace", str(testId), "users"),), tuple(mockPut.call_args))
+        self.assertEqual(mockPut.call_args.args[0], _ep("namespace", str(testId), "users"))
 
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps([namespace_D]), 200))
+    @mock.patch('requests.Session.get', return_value=MockResponse(NAMESPACE_LIST_JSON, 200))
     def testGetNamespaces(self, mockGet):
         res = list(self.argus.namespaces.values())
         self.assertTrue(isinstance(res, list))
         self.assertEqual(len(res), 1)
         self.assertTrue(isinstance(res[0], Namespace))
         self.assertEqual(res[0].to_dict(), namespace_D)
-        self.assertIn((os.path.join(endpoint, "namespace"),), tuple(mockGet.call_args))
+        self.assertEqual(mockGet.call_args.args[0], _ep("namespace"))
+
+
+#: Methods of the service clients that every alert exposes for its triggers and notifications.
+CRUD_METHODS = frozenset(("get", "add", "update", "delete"))
 
 
 class TestAlert(TestServiceBase):
+    def assertChildClients(self, alert):
+        self.assertLessEqual(CRUD_METHODS, set(dir(alert.triggers)))
+        self.assertLessEqual(CRUD_METHODS, set(dir(alert.notifications)))
+
     def testAddInvalidAlert(self):
-        self.assertRaises(TypeError, lambda: self.argus.alerts.add(dict()))
-        self.assertRaises(ValueError, lambda: self.argus.alerts.add(Alert.from_dict(alert_D)))
+        with self.assertRaises(TypeError):
+            self.argus.alerts.add(dict())
+        with self.assertRaises(ValueError):
+            self.argus.alerts.add(fixture_obj(Alert, alert_D))
 
-    @mock.patch('requests.Session.post', return_value=MockResponse(json.dumps(alert_D), 200))
+    @mock.patch('requests.Session.post', return_value=MockResponse(ALERT_JSON, 200))
     def testAddAlert(self, mockPost):
-        alert = Alert.from_dict(alert_D)
+        alert = fixture_obj(Alert, alert_D)
         delattr(alert, "id")
         res = self.argus.alerts.add(alert)
         self.assertTrue(isinstance(res, Alert))
         self.assertTrue(hasattr(res, "id"))
-        for method in ['get', 'add', 'update', 'delete']:
-            self.assertTrue(hasattr(res.triggers, method), msg='no alert.triggers.{}()'.format(method))
-            self.assertTrue(hasattr(res.notifications, method), msg='no alert.notifications.{}()'.format(method))
+        self.assertChildClients(res)
 
-    @mock.patch('requests.Session.put', return_value=MockResponse(json.dumps(alert_D), 200))
+    @mock.patch('requests.Session.put', return_value=MockResponse(ALERT_JSON, 200))
     def testUpdateAlert(self, mockPut):
-        res = self.argus.alerts.update(testId, Alert.from_dict(alert_D))
+        res = self.argus.alerts.update(testId, fixture_obj(Alert, alert_D))
         self.assertTrue(isinstance(self.argus.alerts.get(testId), Alert))
         self.assertEqual(self.argus.alerts.get(testId).to_dict(), alert_D)
-        self.assertIn((os.path.join(endpoint, "alerts", str(testId)),), tuple(mockPut.call_args))
-        for method in ['get', 'add', 'update', 'delete']:
-            self.assertTrue(hasattr(res.triggers, method), msg='no alert.triggers.{}()'.format(method))
-            self.assertTrue(hasattr(res.notifications, method), msg='no alert.notifications.{}()'.format(method))
+        self.assertEqual(mockPut.call_args.args[0], _ep("alerts", str(testId)))
+        self.assertChildClients(res)
 
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps([alert_D]), 200))
+    @mock.patch('requests.Session.get', return_value=MockResponse(ALERT_LIST_JSON, 200))
     def testGetAlerts(self, mockGet):
         res = list(self.argus.alerts.values())
         self.assertTrue(isinstance(res, list))
         self.assertEqual(len(res), 1)
         self.assertTrue(isinstance(res[0], Alert))
         self.assertEqual(res[0].to_dict(), alert_D)
-        self.assertIn((os.path.join(endpoint, "alerts/"),), tuple(mockGet.call_args))
-        for method in ['get', 'add', 'update', 'delete']:
-            self.assertTrue(hasattr(res[0].triggers, method), msg='no alert.triggers.{}()'.format(method))
-            self.assertTrue(hasattr(res[0].notifications, method), msg='no alert.notifications.{}()'.format(method))
+        self.assertEqual(mockGet.call_args.args[0], _ep("alerts/"))
+        self.assertChildClients(res[0])
 
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps(alert_D), 200))
+    @mock.patch('requests.Session.get', return_value=MockResponse(ALERT_JSON, 200))
     def testGetAlert(self, mockGet):
         res = self.argus.alerts.get(testId)
         self.assertTrue(isinstance(res, Alert))
         self.assertEqual(res.to_dict(), alert_D)
-        self.assertIn((os.path.join(endpoint, "alerts", str(testId)),), tuple(mockGet.call_args))
-        for method in ['get', 'add', 'update', 'delete']:
-            self.assertTrue(hasattr(res.triggers, method), msg='no alert.triggers.{}()'.format(method))
-            self.assertTrue(hasattr(res.notifications, method), msg='no alert.notifications.{}()'.format(method))
-
-    @mock.patch('requests.Session.delete', return_value=MockResponse("", 200))
-    def testDeleteAlert(self, mockDelete):
-        self.argus.alerts.delete(testId)
-        self.assertIn((os.path.join(endpoint, "alerts", str(testId)),), tuple(mockDelete.call_args))
+        self.assertEqual(mockGet.call_args.args[0], _ep("alerts", str(testId)))
+        self.assertChildClients(res)
 
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps([alert_D]), 200))
+    @mock.patch('requests.Session.get', return_value=MockResponse(ALERT_LIST_JSON, 200))
     def testGetUserAlert(self, mockGet):
         res = self.argus.alerts.get_user_alert(testId, testId)
         self.assertTrue(isinstance(res, Alert))
         self.assertEqual(res.to_dict(), alert_D)
-        self.assertIn((os.path.join(endpoint, "alerts/meta"),), tuple(mockGet.call_args))
+        self.assertEqual(mockGet.call_args.args[0], _ep("alerts/meta"))
 
     @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps([]), 200))
     def testGetUserAlertNoMatch(self, mockGet):
         res = self.argus.alerts.get_user_alert(testId, testId)
         self.assertEqual(res, None)
-        self.assertIn((os.path.join(endpoint, "alerts/meta"),), tuple(mockGet.call_args))
+        self.assertEqual(mockGet.call_args.args[0], _ep("alerts/meta"))
 
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps([alert_D, alert_D]), 200))
+    @mock.patch('requests.Session.get', return_value=MockResponse(DUPLICATE_ALERTS_JSON, 200))
     def testGetUserAlertUnexpectedMultiple(self, mockGet):
-        self.assertRaises(AssertionError, lambda: self.argus.alerts.get_user_alert(testId, testId))
-        self.assertIn((os.path.join(endpoint, "alerts/meta"),), tuple(mockGet.call_args))
+        with self.assertRaises(AssertionError):
+            self.argus.alerts.get_user_alert(testId, testId)
+        self.assertEqual(mockGet.call_args.args[0], _ep("alerts/meta"))
 
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps([alert_D, alert_D]), 200))
+    @mock.patch('requests.Session.get', return_value=MockResponse(DUPLICATE_ALERTS_JSON, 200))
     def testGetAlertsAllInfo(self, mockGet):
         res = self.argus.alerts.get_alerts_allinfo(userName)
         if res:
             for obj in res:
                 self.assertTrue(isinstance(obj, Alert))
-        self.assertIn((os.path.join(endpoint, "alerts/allinfo"),), tuple(mockGet.call_args))
+        self.assertEqual(mockGet.call_args.args[0], _ep("alerts/allinfo"))
 
     # Test items() where get_all_path is the allinfo one
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps([alert_all_info_D, alert_all_info_2_D]), 200))
+    @mock.patch('requests.Session.get', return_value=MockResponse(ALERTS_ALL_INFO_JSON, 200))
     def testGetItemsAllInfo(self, mockGet):
         self.assertEqual(len(mockGet.call_args_list), 0)
-        self.argus.alerts = AlertsServiceClient(self.argus, get_all_req_opts={REQ_PARAMS: dict(shared=False),
-                                                                              REQ_PATH: "allinfo"})
-        alertClient = self.argus.alerts
+        alertClient = AlertsServiceClient(self.argus, get_all_req_opts={REQ_PARAMS: dict(shared=False),
+                                                                        REQ_PATH: "allinfo"})
 
         # Act
         res = list(alertClient.items())
         # Assert
         self.assertEqual(len(mockGet.call_args_list), 1)
-        self.assertIn((os.path.join(endpoint, "alerts/allinfo"),), tuple(mockGet.call_args))
+        self.assertEqual(mockGet.call_args.args[0], _ep("alerts/allinfo"))
         self.assertEqual(len(res), 2)
 
         for id, obj in res:
@@ -630,7 +774,7 @@ class TestAlert(TestServiceBase):
         res = list(alertClient.items())
         # Assert
         self.assertEqual(len(res), 2)
-        self.assertIn((os.path.join(endpoint, "alerts/"),), tuple(mockGet.call_args))
+        self.assertEqual(mockGet.call_args.args[0], _ep("alerts/"))
         self.assertEqual(len(mockGet.call_args_list), 1)
 
         for id, obj in res:
@@ -642,7 +786,7 @@ class TestAlert(TestServiceBase):
             items = list(alert.triggers.items())
             # Assert
             self.assertEqual(len(items), 2)
-            self.assertIn("triggers", mockGet.call_args[0][0])
+            self.assertEqual(mockGet.call_args.args[0], _ep("alerts", str(id), "triggers"))
             for item in items:
                 self.assertTrue(isinstance(item[1], Trigger))
 
@@ -650,160 +794,179 @@ class TestAlert(TestServiceBase):
             items = list(alert.notifications.items())
             # Assert
             self.assertEqual(len(items), 3)
-            self.assertIn("notifications", mockGet.call_args[0][0])
+            self.assertEqual(mockGet.call_args.args[0], _ep("alerts", str(id), "notifications"))
             for item in items:
                 self.assertTrue(isinstance(item[1], Notification))
 
         self.assertEqual(len(mockGet.call_args_list), 5)
 
 class TestAlertTrigger(TestServiceBase):
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps(alert_D), 200))
+    @classmethod
+    def setUpClass(cls):
+        super(TestAlertTrigger, cls).setUpClass()
+        # The trigger to add, without the id that Argus assigns, the tests add copies of it.
+        cls.newTrigger = fixture_obj(Trigger, trigger_D)
+        delattr(cls.newTrigger, "id")
+
+    @mock.patch('requests.Session.get', return_value=MockResponse(ALERT_JSON, 200))
     def setUp(self, mockGet):
         super(TestAlertTrigger, self).setUp()
         self.alert = self.argus.alerts.get(testId)
 
     def testAddInvalidTrigger(self):
-        self.assertRaises(TypeError, lambda: self.alert.triggers.add(dict()))
-        self.assertRaises(ValueError, lambda: self.alert.triggers.add(Trigger.from_dict(trigger_D)))
+        with self.assertRaises(TypeError):
+            self.alert.triggers.add(dict())
+        with self.assertRaises(ValueError):
+            self.alert.triggers.add(fixture_obj(Trigger, trigger_D))
 
-    @mock.patch('requests.Session.post', return_value=MockResponse(json.dumps([trigger_D]), 200))
+    @mock.patch('requests.Session.post', return_value=MockResponse(TRIGGER_LIST_JSON, 200))
     def testAddTrigger(self, mockPost):
-        trigger = Trigger.from_dict(trigger_D)
-        delattr(trigger, "id")
+        trigger = copy.copy(self.newTrigger)
         res = self.alert.triggers.add(trigger)
         self.assertTrue(isinstance(res, Trigger))
         self.assertTrue(hasattr(res, "id"))
-        self.assertIn((os.path.join(endpoint, "alerts", str(testId), "triggers"),), tuple(mockPost.call_args))
+        self.assertEqual(mockPost.call_args.args[0], TRIGGERS_URL)
         self.assertEqual(self.alert.triggers[testId].argus_id, testId)
 
-    @mock.patch('requests.Session.put', return_value=MockResponse(json.dumps(trigger_D), 200))
+    @mock.patch('requests.Session.put', return_value=MockResponse(TRIGGER_JSON, 200))
     def testUpdateTrigger(self, mockPut):
-        self.alert.triggers.update(testId, Trigger.from_dict(trigger_D))
+        self.alert.triggers.update(testId, fixture_obj(Trigger, trigger_D))
         self.assertTrue(isinstance(self.alert.triggers.get(testId), Trigger))
         self.assertEqual(self.alert.triggers.get(testId).to_dict(), trigger_D)
-        self.assertIn((os.path.join(endpoint, "alerts", str(testId), "triggers", str(testId)),), tuple(mockPut.call_args))
+        self.assertEqual(mockPut.call_args.args[0], TRIGGER_URL)
 
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps([trigger_D]), 200))
+    @mock.patch('requests.Session.get', return_value=MockResponse(TRIGGER_LIST_JSON, 200))
     def testGetTriggers(self, mockGet):
         res = list(self.alert.triggers.values())
         self.assertTrue(isinstance(res, list))
         self.assertEqual(len(res), 1)
         self.assertTrue(isinstance(res[0], Trigger))
         self.assertEqual(res[0].to_dict(), trigger_D)
-        self.assertIn((os.path.join(endpoint, "alerts", str(testId), "triggers"),), tuple(mockGet.call_args))
+        self.assertEqual(mockGet.call_args.args[0], TRIGGERS_URL)
 
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps(trigger_D), 200))
+    @mock.patch('requests.Session.get', return_value=MockResponse(TRIGGER_JSON, 200))
     def testGetTrigger(self, mockGet):
         res = self.alert.triggers.get(testId)
         self.assertTrue(isinstance(res, Trigger))
         self.assertEqual(res.to_dict(), trigger_D)
-        self.assertIn((os.path.join(endpoint, "alerts", str(testId), "triggers", str(testId)),), tuple(mockGet.call_args))
+        self.assertEqual(mockGet.call_args.args[0], TRIGGER_URL)
 
     @mock.patch('requests.Session.delete', return_value=MockResponse("", 200))
     def testDeleteTrigger(self, mockDelete):
-        with mock.patch('requests.Session.post', return_value=MockResponse(json.dumps([trigger_D]), 200)):
-            trigger = Trigger.from_dict(trigger_D)
-            delattr(trigger, "id")
+        with mock.patch('requests.Session.post', return_value=MockResponse(TRIGGER_LIST_JSON, 200)):
+            trigger = copy.copy(self.newTrigger)
             self.alert.triggers.add(trigger)
         self.alert.triggers.delete(testId)
-        self.assertIn((os.path.join(endpoint, "alerts", str(testId), "triggers", str(testId)),), tuple(mockDelete.call_args))
+        self.assertEqual(mockDelete.call_args.args[0], TRIGGER_URL)
         # With delete removing the entry from alert.triggers, the following lookup would result in
         # a fresh get call.
         with mock.patch('requests.Session.get', return_value=MockResponse("", 404)) as mockGet:
-            self.assertRaises(ArgusObjectNotFoundException, lambda: self.alert.triggers[testId])
-            self.assertIn((os.path.join(endpoint, "alerts", str(testId), "triggers", str(testId)),), tuple(mockGet.call_args))
+            with self.assertRaises(ArgusObjectNotFoundException):
+                self.alert.triggers[testId]
+            self.assertEqual(mockGet.call_args.args[0], TRIGGER_URL)
 
 
 class TestAlertNotification(TestServiceBase):
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps(alert_D), 200))
+    @classmethod
+    def setUpClass(cls):
+        super(TestAlertNotification, cls).setUpClass()
+        # The notification to add, without the id that Argus assigns, the tests add copies of it.
+        cls.newNotification = fixture_obj(Notification, notification_D)
+        delattr(cls.newNotification, "id")
+
+    @mock.patch('requests.Session.get', return_value=MockResponse(ALERT_JSON, 200))
     def setUp(self, mockGet):
         super(TestAlertNotification, self).setUp()
         self.alert = self.argus.alerts.get(testId)
 
     def testAddInvalidNotification(self):
-        self.assertRaises(TypeError, lambda: self.alert.notifications.add(dict()))
-        self.assertRaises(ValueError, lambda: self.alert.notifications.add(Notification.from_dict(notification_D)))
+        with self.assertRaises(TypeError):
+            self.alert.notifications.add(dict())
+        with self.assertRaises(ValueError):
+            self.alert.notifications.add(fixture_obj(Notification, notification_D))
 
-    @mock.patch('requests.Session.post', return_value=MockResponse(json.dumps([notification_D]), 200))
+    @mock.patch('requests.Session.post', return_value=MockResponse(NOTIFICATION_LIST_JSON, 200))
     def testAddNotification(self, mockPost):
-        notification = Notification.from_dict(notification_D)
-        delattr(notification, "id")
+        notification = copy.copy(self.newNotification)
         res = self.alert.notifications.add(notification)
         self.assertTrue(isinstance(res, Notification))
         self.assertTrue(hasattr(res, "id"))
-        self.assertIn((os.path.join(endpoint, "alerts", str(testId), "notifications"),), tuple(mockPost.call_args))
+        self.assertEqual(mockPost.call_args.args[0], NOTIFICATIONS_URL)
         self.assertEqual(self.alert.notifications[testId].argus_id, testId)
 
-    @mock.patch('requests.Session.put', return_value=MockResponse(json.dumps(notification_D), 200))
+    @mock.patch('requests.Session.put', return_value=MockResponse(NOTIFICATION_JSON, 200))
     def testUpdateNotification(self, mockPut):
-        self.alert.notifications.update(testId, Notification.from_dict(notification_D))
+        self.alert.notifications.update(testId, fixture_obj(Notification, notification_D))
         self.assertTrue(isinstance(self.alert.notifications.get(testId), Notification))
         self.assertEqual(self.alert.notifications.get(testId).to_dict(), notification_D)
-        self.assertIn((os.path.join(endpoint, "alerts", str(testId), "notifications", str(testId)),), tuple(mockPut.call_args))
+        self.assertEqual(mockPut.call_args.args[0], NOTIFICATION_URL)
 
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps([notification_D]), 200))
+    @mock.patch('requests.Session.get', return_value=MockResponse(NOTIFICATION_LIST_JSON, 200))
     def testGetNotifications(self, mockGet):
         res = list(self.alert.notifications.values())
         self.assertTrue(isinstance(res, list))
         self.assertEqual(len(res), 1)
         self.assertTrue(isinstance(res[0], Notification))
         self.assertEqual(res[0].to_dict(), notification_D)
-        self.assertIn((os.path.join(endpoint, "alerts", str(testId), "notifications"),), tuple(mockGet.call_args))
+        self.assertEqual(mockGet.call_args.args[0], NOTIFICATIONS_URL)
 
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps(notification_D), 200))
+    @mock.patch('requests.Session.get', return_value=MockResponse(NOTIFICATION_JSON, 200))
     def testGetNotification(self, mockGet):
         res = self.alert.notifications.get(testId)
         self.assertTrue(isinstance(res, Notification))
         self.assertEqual(res.to_dict(), notification_D)
-        self.assertIn((os.path.join(endpoint, "alerts", str(testId), "notifications", str(testId)),), tuple(mockGet.call_args))
+        self.assertEqual(mockGet.call_args.args[0], NOTIFICATION_URL)
 
     @mock.patch('requests.Session.delete', return_value=MockResponse("", 200))
     def testDeleteNotification(self, mockDelete):
-        with mock.patch('requests.Session.post', return_value=MockResponse(json.dumps([notification_D]), 200)):
-            notification = Notification.from_dict(notification_D)
-            delattr(notification, "id")
+        with mock.patch('requests.Session.post', return_value=MockResponse(NOTIFICATION_LIST_JSON, 200)):
+            notification = copy.copy(self.newNotification)
             self.alert.notifications.add(notification)
         self.alert.notifications.delete(testId)
-        self.assertIn((os.path.join(endpoint, "alerts", str(testId), "notifications", str(testId)),), tuple(mockDelete.call_args))
+        self.assertEqual(mockDelete.call_args.args[0], NOTIFICATION_URL)
         # With delete removing the entry from alert.notifications, the following lookup would result in
         # a fresh get call.
         with mock.patch('requests.Session.get', return_value=MockResponse("", 404)) as mockGet:
-            self.assertRaises(ArgusObjectNotFoundException, lambda: self.alert.notifications[testId])
-            self.assertIn((os.path.join(endpoint, "alerts", str(testId), "notifications", str(testId)),), tuple(mockGet.call_args))
+            with self.assertRaises(ArgusObjectNotFoundException):
+                self.alert.notifications[testId]
+            self.assertEqual(mockGet.call_args.args[0], NOTIFICATION_URL)
 
 
 class TestNotificationTrigger(TestServiceBase):
     def testAddInvalidNotificationTrigger(self):
-        self.assertRaises(ValueError, lambda: self.argus.alerts.add_notification_trigger(None, testId, testId))
-        self.assertRaises(ValueError, lambda: self.argus.alerts.add_notification_trigger(testId, None, testId))
-        self.assertRaises(ValueError, lambda: self.argus.alerts.add_notification_trigger(testId, testId, None))
-
-    @mock.patch('requests.Session.post', return_value=MockResponse(json.dumps(trigger_D), 200))
+        with self.assertRaises(ValueError):
+            self.argus.alerts.add_notification_trigger(None, testId, testId)
+        with self.assertRaises(ValueError):
+            self.argus.alerts.add_notification_trigger(testId, None, testId)
+        with self.assertRaises(ValueError):
+            self.argus.alerts.add_notification_trigger(testId, testId, None)
+
+    @mock.patch('requests.Session.post', return_value=MockResponse(TRIGGER_JSON, 200))
     def testAddNotificationTrigger(self, mockPost):
         res = self.argus.alerts.add_notification_trigger(testId, testId, testId)
         self.assertTrue(isinstance(res, Trigger))
-        self.assertIn((os.path.join(endpoint, "alerts", str(testId), "notifications", str(testId), "triggers", str(testId)),), tuple(mockPost.call_args))
+        self.assertEqual(mockPost.call_args.args[0], NOTIF_TRIGGER_URL)
 
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps([trigger_D]), 200))
+    @mock.patch('requests.Session.get', return_value=MockResponse(TRIGGER_LIST_JSON, 200))
     def testGetNotificationTriggers(self, mockGet):
         res = self.argus.alerts.get_notification_triggers(testId, testId)
         self.assertTrue(isinstance(res, list))
         self.assertEqual(len(res), 1)
         self.assertTrue(isinstance(res[0], Trigger))
         self.assertEqual(res[0].to_dict(), trigger_D)
-        self.assertIn((os.path.join(endpoint, "alerts", str(testId), "notifications", str(testId), "triggers"),), tuple(mockGet.call_args))
+        self.assertEqual(mockGet.call_args.args[0], NOTIF_TRIGGERS_URL)
 
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps(trigger_D), 200))
+    @mock.patch('requests.Session.get', return_value=MockResponse(TRIGGER_JSON, 200))
     def testGetNotificationTrigger(self, mockGet):
         res = self.argus.alerts.get_notification_trigger(testId, testId, testId)
         self.assertTrue(isinstance(res, Trigger))
         self.assertEqual(res.to_dict(), trigger_D)
-        self.assertIn((os.path.join(endpoint, "alerts", str(testId), "notifications", str(testId), "triggers", str(testId)),), tuple(mockGet.call_args))
+        self.assertEqual(mockGet.call_args.args[0], NOTIF_TRIGGER_URL)
 
     @mock.patch('requests.Session.delete', return_value=MockResponse("", 200))
     def testDeleteNotificationTrigger(self, mockDelete):
         self.argus.alerts.delete_notification_trigger(testId, testId, testId)
-        self.assertIn((os.path.join(endpoint, "alerts", str(testId), "notifications", str(testId), "triggers", str(testId)),), tuple(mockDelete.call_args))
+        self.assertEqual(mockDelete.call_args.args[0], NOTIF_TRIGGER_URL)
 
 
 class TestAlertMultipleNotifications(TestServiceBase):
@@ -819,8 +982,7 @@ class TestAlertMultipleNotifications(TestServiceBase):
 
     def testGetAlertWithMultipleNotifications(self):
         with mock.patch('requests.Session.get', return_value=MockResponse(json.dumps(self.alert_dict), 200)):
-            return self.argus.alerts.get(testId)
-        alert = get_alert()
+            alert = self.argus.alerts.get(testId)
         self.assertEqual(alert.notificationIds, [100, 101])
 
         with mock.patch('requests.Session.get', return_value=MockResponse(json.dumps([self.notif1_dict, self.notif2_dict]), 200)):
@@ -842,8 +1004,7 @@ class TestAlertMultipleTriggers(TestServiceBase):
 
     def testGetAlertWithMultipleTriggers(self):
         with mock.patch('requests.Session.get', return_value=MockResponse(json.dumps(self.alert_dict), 200)):
-            return self.argus.alerts.get(testId)
-        alert = get_alert()
+            alert = self.argus.alerts.get(testId)
         self.assertEqual(alert.triggerIds, [100, 101])
 
         with mock.patch('requests.Session.get', return_value=MockResponse(json.dumps([self.trigr1_dict, self.trigr2_dict]), 200)):
@@ -856,7 +1017,7 @@ class TestAlertMultipleTriggers(TestServiceBase):
 class TestCompositeAlert(TestServiceBase):
 
     def _createCompAlert(self):
-        with mock.patch('requests.Session.post', return_value=MockResponse(json.dumps(compalert_D), 200)) as mock_add_comp_alert:
+        with mock.patch('requests.Session.post', return_value=MockResponse(COMPALERT_JSON, 200)) as mock_add_comp_alert:
             alert = Alert.from_dict(compalert_D)
             self.assertTrue(isinstance(alert, Alert))
             delattr(alert, "id")
@@ -864,9 +1025,8 @@ class TestCompositeAlert(TestServiceBase):
             self.assertTrue(isinstance(comp_alert, Alert))
             self.assertTrue(hasattr(comp_alert, "id"))
             self.assertEqual(comp_alert.expression['expression']['operator'], 'AND')
-            call_args = mock_add_comp_alert.call_args
-            uri_path = os.path.join(endpoint, "alerts")
-            self.assertIn((uri_path,), call_args)
+            uri_path = _ep("alerts")
+            self.assertEqual(mock_add_comp_alert.call_args.args[0], uri_path)
             return comp_alert 
 
     def testAddCompAlert(self):
@@ -876,7 +1036,7 @@ class TestCompositeAlert(TestServiceBase):
     def testAddChildAlert(self):
         comp_alert = self._createCompAlert()
 
-        with mock.patch('requests.Session.post', return_value=MockResponse(json.dumps(childAlert_1), 200)):
+        with mock.patch('requests.Session.post', return_value=MockResponse(CHILD_ALERT_1_JSON, 200)):
             child_alert = self.argus.alerts.add_child_alert_to_composite_alert(comp_alert.id, Alert.from_dict(childAlert_1))
         self.assertEqual(child_alert.alertType, 'COMPOSITE_CHILD')
         self.assertTrue(isinstance(child_alert, Alert))
@@ -884,40 +1044,37 @@ class TestCompositeAlert(TestServiceBase):
     def testAddTriggerToChildAlert(self):
         comp_alert = self._createCompAlert()
 
-        with mock.patch('requests.Session.post', return_value=MockResponse(json.dumps(childAlert_1), 200)) as mock_add_childalert:
+        with mock.patch('requests.Session.post', return_value=MockResponse(CHILD_ALERT_1_JSON, 200)) as mock_add_childalert:
             child_alert = self.argus.alerts.add_child_alert_to_composite_alert(comp_alert.id,
                                                                                Alert.from_dict(childAlert_1))
             self.assertEqual(child_alert.alertType, 'COMPOSITE_CHILD')
             self.assertTrue(isinstance(child_alert, Alert))
-            call_args = tuple(mock_add_childalert.call_args)
-            uri_path = os.path.join(endpoint, "alerts/{}/children".format(comp_alert.id))
-            self.assertIn((uri_path,), call_args)
+            uri_path = _ep(f"alerts/{comp_alert.id}/children")
+            self.assertEqual(mock_add_childalert.call_args.args[0], uri_path)
 
-        with mock.patch('requests.Session.post', return_value=MockResponse(json.dumps([childAlert_trigger_1]), 200)) as mock_trigger_post:
+        with mock.patch('requests.Session.post', return_value=MockResponse(CHILD_ALERT_TRIGGER_LIST_JSON, 200)) as mock_trigger_post:
             trigger_obj = Trigger.from_dict(childAlert_trigger_1)
             delattr(trigger_obj, "id")
             trigger = child_alert.triggers.add(trigger_obj)
             self.assertTrue(isinstance(trigger, Trigger))
-            call_args = tuple(mock_trigger_post.call_args)
-            uri_path = os.path.join(endpoint, "alerts/{}/triggers".format(child_alert.id))
-            self.assertIn((uri_path,), call_args)
+            uri_path = _ep(f"alerts/{child_alert.id}/triggers")
+            self.assertEqual(mock_trigger_post.call_args.args[0], uri_path)
 
     def testAddNotification(self):
         comp_alert = self._createCompAlert()
 
-        with mock.patch('requests.Session.post', return_value=MockResponse(json.dumps([compAlert_notification]), 200)) as mock_notification:
+        with mock.patch('requests.Session.post', return_value=MockResponse(COMP_ALERT_NOTIFICATION_LIST_JSON, 200)) as mock_notification:
             notification_obj = Notification.from_dict(compAlert_notification)
             delattr(notification_obj, "id")
             notification = comp_alert.notifications.add(notification_obj)
             self.assertTrue(isinstance(notification, Notification))
-            call_args = mock_notification.call_args
-            uri_path = os.path.join(endpoint, "alerts/{}/notifications".format(comp_alert.id))
-            self.assertIn((uri_path,), call_args)
+            uri_path = _ep(f"alerts/{comp_alert.id}/notifications")
+            self.assertEqual(mock_notification.call_args.args[0], uri_path)
 
 
     def testDeleteChildAlert(self):
         comp_alert = self._createCompAlert()
-        with mock.patch('requests.Session.post', return_value=MockResponse(json.dumps(childAlert_1), 200)):
+        with mock.patch('requests.Session.post', return_value=MockResponse(CHILD_ALERT_1_JSON, 200)):
             child_alert = self.argus.alerts.add_child_alert_to_composite_alert(comp_alert.id, Alert.from_dict(childAlert_1))
             self.assertEqual(child_alert.alertType, 'COMPOSITE_CHILD')
             self.assertTrue(isinstance(child_alert, Alert))
@@ -929,159 +1086,124 @@ class TestCompositeAlert(TestServiceBase):
         res = self.argus.alerts.get(child_alert.id)
         with mock.patch('requests.Session.delete', return_value=MockResponse("", 200)) as mock_delete:
             self.argus.alerts.delete_child_alert_from_composite_alert(comp_alert.id, child_alert.id)
-            call_args = mock_delete.call_args
-            uri_path = os.path.join(endpoint, "alerts/{}/children/{}".format(comp_alert.id, child_alert.id))
-            self.assertIn((uri_path,), call_args)
+            uri_path = _ep(f"alerts/{comp_alert.id}/children/{child_alert.id}")
+            self.assertEqual(mock_delete.call_args.args[0], uri_path)
 
         '''
         After delete, the object should be gone from the local cache, so the get should result in an API call which
         we are mocking to raise a 404 to mimic the real scenario
         '''
         with mock.patch('requests.Session.get', return_value=MockResponse("", 404)) as mockGet:
-            self.assertRaises(ArgusObjectNotFoundException, lambda: self.argus.alerts.get(child_alert.id))
+            with self.assertRaises(ArgusObjectNotFoundException):
+                self.argus.alerts.get(child_alert.id)
 
     def testDeleteTriggerFromChildAlert(self):
         comp_alert = self._createCompAlert()
 
-        with mock.patch('requests.Session.post', return_value=MockResponse(json.dumps(childAlert_1), 200)) as mock_add_childalert:
+        with mock.patch('requests.Session.post', return_value=MockResponse(CHILD_ALERT_1_JSON, 200)) as mock_add_childalert:
             child_alert = self.argus.alerts.add_child_alert_to_composite_alert(comp_alert.id,
                                                                                Alert.from_dict(childAlert_1))
             self.assertEqual(child_alert.alertType, 'COMPOSITE_CHILD')
             self.assertTrue(isinstance(child_alert, Alert))
-            call_args = tuple(mock_add_childalert.call_args)
-            uri_path = os.path.join(endpoint, "alerts/{}/children".format(comp_alert.id))
-            self.assertIn((uri_path,), call_args)
+            uri_path = _ep(f"alerts/{comp_alert.id}/children")
+            self.assertEqual(mock_add_childalert.call_args.args[0], uri_path)
 
-        with mock.patch('requests.Session.post', return_value=MockResponse(json.dumps([childAlert_trigger_1]), 200)) as mock_trigger_post:
+        with mock.patch('requests.Session.post', return_value=MockResponse(CHILD_ALERT_TRIGGER_LIST_JSON, 200)) as mock_trigger_post:
             trigger_obj = Trigger.from_dict(childAlert_trigger_1)
             delattr(trigger_obj,"id")
             trigger = child_alert.triggers.add(trigger_obj)
             self.assertTrue(isinstance(trigger, Trigger))
-            call_args = tuple(mock_trigger_post.call_args)
-            uri_path = os.path.join(endpoint, "alerts/{}/triggers".format(child_alert.id))
-            self.assertIn((uri_path,), call_args)
+            uri_path = _ep(f"alerts/{child_alert.id}/triggers")
+            self.assertEqual(mock_trigger_post.call_args.args[0], uri_path)
 
         with mock.patch('requests.Session.delete', return_value=MockResponse("", 200)) as mock_delete:
             child_alert.triggers.delete(trigger.id)
-            call_args = tuple(mock_trigger_post.call_args)
-            uri_path = os.path.join(endpoint, "alerts/{}/triggers".format(child_alert.id))
-            self.assertIn((uri_path,), call_args)
+            uri_path = _ep(f"alerts/{child_alert.id}/triggers")
+            self.assertEqual(mock_trigger_post.call_args.args[0], uri_path)
 
     def testDeleteNotification(self):
         comp_alert = self._createCompAlert()
 
-        with mock.patch('requests.Session.post', return_value=MockResponse(json.dumps([compAlert_notification]), 200)) as mock_notification:
+        with mock.patch('requests.Session.post', return_value=MockResponse(COMP_ALERT_NOTIFICATION_LIST_JSON, 200)) as mock_notification:
             notification_obj = Notification.from_dict(compAlert_notification)
             delattr(notification_obj, "id")
             notification = comp_alert.notifications.add(notification_obj)
             self.assertTrue(isinstance(notification, Notification))
-            call_args = mock_notification.call_args
-            uri_path = os.path.join(endpoint, "alerts/{}/notifications".format(comp_alert.id))
-            self.assertIn((uri_path,), call_args)
+            uri_path = _ep(f"alerts/{comp_alert.id}/notifications")
+            self.assertEqual(mock_notification.call_args.args[0], uri_path)
 
         with mock.patch('requests.Session.delete', return_value=MockResponse("", 200)) as mock_delete:
             comp_alert.notifications.delete(notification.id)
-            call_args = tuple(mock_delete.call_args)
-            uri_path = os.path.join(endpoint, "alerts/{}/notifications/{}".format(comp_alert.id, notification.id))
-            self.assertIn((uri_path,), call_args)
+            uri_path = _ep(f"alerts/{comp_alert.id}/notifications/{notification.id}")
+            self.assertEqual(mock_delete.call_args.args[0], uri_path)
 
     def testGetCompAlertChildrenInfo(self):
-        with mock.patch('requests.Session.get', return_value=MockResponse(json.dumps([childAlert_1, childAlert_2]), 200)) as mock_get:
+        with mock.patch('requests.Session.get', return_value=MockResponse(CHILD_ALERTS_JSON, 200)) as mock_get:
             res = self.argus.alerts.get_composite_alert_children_info(compAlertID)
             if res:
                 for obj in res:
                     self.assertTrue(isinstance(obj, Alert))
-            call_args = tuple(mock_get.call_args)
-            uri_path = os.path.join(endpoint, "alerts/{}/children/info".format(compAlertID))
-            self.assertIn((uri_path,), call_args)
+            uri_path = _ep(f"alerts/{compAlertID}/children/info")
+            self.assertEqual(mock_get.call_args.args[0], uri_path)
 
     def testGetCompAlertChildren(self):
-        with mock.patch('requests.Session.get', return_value=MockResponse(json.dumps([childAlert_1, childAlert_2]), 200)) as mock_get:
+        with mock.patch('requests.Session.get', return_value=MockResponse(CHILD_ALERTS_JSON, 200)) as mock_get:
             res = self.argus.alerts.get_composite_alert_children(compAlertID)
             if res:
                 for obj in res:
                     self.assertTrue(isinstance(obj, Alert))
-            call_args = tuple(mock_get.call_args)
-            uri_path = os.path.join(endpoint, "alerts/{}/children".format(compAlertID))
-            self.assertIn((uri_path,), call_args)
+            uri_path = _ep(f"alerts/{compAlertID}/children")
+            self.assertEqual(mock_get.call_args.args[0], uri_path)
 
     def testUpdateCompAlert(self):
         comp_alert = self._createCompAlert()
 
-        with mock.patch('requests.Session.put', return_value=MockResponse(json.dumps(compalert_D), 200)) as mock_update:
+        with mock.patch('requests.Session.put', return_value=MockResponse(COMPALERT_JSON, 200)) as mock_update:
             self.argus.alerts.update(compAlertID, Alert.from_dict(compalert_D))
             alert_obj = self.argus.alerts.get(compAlertID)
             self.assertTrue(isinstance(alert_obj, Alert))
             alert_obj_dict = alert_obj.to_dict()
             alert_dict = compalert_D
             self.assertEqual(alert_obj_dict, alert_dict)
-            call_args = mock_update.call_args
-            uri_path = os.path.join(endpoint, "alerts/{}".format(compAlertID))
-            self.assertIn((uri_path,), call_args)
+            uri_path = _ep(f"alerts/{compAlertID}")
+            self.assertEqual(mock_update.call_args.args[0], uri_path)
 
 class TestDerivative(TestServiceBase):
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps(derivative_1_D), 200))
-    def testGetDerivativeById(self, mockGet):
-        res = self.argus.derivatives.get(derivativeID_1)
-        self.assertTrue(isinstance(res, Derivative))
-        self.assertEquals(res.to_dict(), derivative_1_D)
-        self.assertIn((os.path.join(endpoint, "derivatives", str(derivativeID_1)),), tuple(mockGet.call_args))
-
     def testGetDerivativeNoId(self):
-        self.failUnlessRaises(ValueError, lambda: self.argus.derivatives.get(None))
-
-    @mock.patch('requests.Session.post', return_value = MockResponse(json.dumps(derivative_1_D), 200))
-    def testAddDerivative(self, mockPost):
-        derivative = Derivative.from_dict(derivative_1_D)
-        delattr(derivative, "id")
-        res = self.argus.derivatives.add(derivative)
-        self.assertTrue(isinstance(res, Derivative))
-        self.assertTrue(hasattr(res, "id"))
-        self.assertIn((os.path.join(endpoint, "derivatives"),), tuple(mockPost.call_args))
-
-    @mock.patch('requests.Session.put', return_value = MockResponse(json.dumps(derivative_1_D), 200))
-    def testUpdateDerivative(self, mockPut):
-        self.argus.derivatives.update(derivativeID_1, Derivative.from_dict(derivative_1_D))
-        self.assertTrue(isinstance(self.argus.derivatives.get(derivativeID_1), Derivative))
-        self.assertEquals(self.argus.derivatives.get(derivativeID_1).to_dict(), derivative_1_D)
-        self.assertIn((os.path.join(endpoint, "derivatives", str(derivativeID_1)),), tuple(mockPut.call_args))
-
-    @mock.patch('requests.Session.delete', return_value=MockResponse("", 200))
-    def testDeleteDerivative(self, mockDelete):
-        self.argus.derivatives.delete(derivativeID_1)
-        self.assertIn((os.path.join(endpoint, "derivatives", str(derivativeID_1)),), tuple(mockDelete.call_args))
+        with self.assertRaises(ValueError):
+            self.argus.derivatives.get(None)
 
     @mock.patch('requests.Session.get', return_value=MockResponse("[]", 200))
     def testGetUserDerivativeNonExisting(self, mockGet):
         res = self.argus.derivatives.get(derivativeID_1)
         self.assertTrue(not res)
 
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps(derivative_1_D), 200))
+    @mock.patch('requests.Session.get', return_value=MockResponse(DERIVATIVE_1_JSON, 200))
     def testGetUserDerivatives(self, mockGet):
         res = self.argus.derivatives.get_user_derivatives(mockGet)
         self.assertTrue(res is not None)
-        self.assertIn((os.path.join(endpoint, "derivatives/meta"),), tuple(mockGet.call_args))
+        self.assertEqual(mockGet.call_args.args[0], _ep("derivatives/meta"))
 
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps(derivative_1_D), 200))
+    @mock.patch('requests.Session.get', return_value=MockResponse(DERIVATIVE_1_JSON, 200))
     def testGetUserDerivativesPage(self, mockGet):
         res = self.argus.derivatives.get_user_derivatives_page(mockGet)
         self.assertTrue(res is not None)
-        self.assertIn((os.path.join(endpoint, "derivatives/meta/user"),), tuple(mockGet.call_args))
+        self.assertEqual(mockGet.call_args.args[0], _ep("derivatives/meta/user"))
 
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps(derivative_1_D), 200))
+    @mock.patch('requests.Session.get', return_value=MockResponse(DERIVATIVE_1_JSON, 200))
     def testGetUserDerivativesCount(self, mockGet):
         res = self.argus.derivatives.get_user_derivatives_count(mockGet)
         self.assertTrue(res is not None)
-        self.assertIn((os.path.join(endpoint, "derivatives/meta/user/count"),), tuple(mockGet.call_args))
+        self.assertEqual(mockGet.call_args.args[0], _ep("derivatives/meta/user/count"))
 
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps(derivative_1_D), 200))
+    @mock.patch('requests.Session.get', return_value=MockResponse(DERIVATIVE_1_JSON, 200))
     def testGetSharedUserDerivatives(self, mockGet):
         res = self.argus.derivatives.get_shared_user_derivatives(mockGet)
         self.assertTrue(res is not None)
-        self.assertIn((os.path.join(endpoint, "derivatives/meta/shared"),), tuple(mockGet.call_args))
+        self.assertEqual(mockGet.call_args.args[0], _ep("derivatives/meta/shared"))
 
-    @mock.patch('requests.Session.get', return_value=MockResponse(json.dumps(derivative_1_D), 200))
+    @mock.patch('requests.Session.get', return_value=MockResponse(DERIVATIVE_1_JSON, 200))
     def testGetSharedUserDerivativesCount(self, mockGet):
         res = self.argus.derivatives.get_shared_user_derivatives_count(mockGet)
         self.assertTrue(res is not None)
-        self.assertIn((os.path.join(endpoint, "derivatives/meta/shared/count"),), tuple(mockGet.call_args))
+        self.assertEqual(mockGet.call_args.args[0], _ep("derivatives/meta/shared/count"))